@@ -10,22 +10,39 @@ ________________________________________________________________________________
 from __future__ import annotations
 
 import os
-from typing import Optional
-from json import dumps
+import queue
+import threading
+from typing import Callable, Optional
+from json import dumps, JSONEncoder
 
 from tkinter.filedialog import asksaveasfilename, askopenfilename
 
+import numpy as np
+try:
+    # Numba is optional, it only compiles the grid kernels of the editor
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*_args, **_kwargs):
+        """Fallback decorator keeping the kernels in pure Python."""
+        return lambda func: func
+
 import pygame
-from pygame import MOUSEBUTTONDOWN, NOFRAME, QUIT, Rect, Vector2, display, time, SRCALPHA
+from pygame import (MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION, MOUSEWHEEL, KEYDOWN, NOFRAME,
+                    QUIT, Rect, Vector2, display, time, SRCALPHA)
 
 from game_libs import config
 from game_libs.assets_registry import AssetsRegistry
 from game_libs.ecs_core.engine import Engine
 from game_libs.level.components import Camera
-from game_libs.level.tilemap import TilesetData, TilemapData, FixedParallaxData, TilemapParallaxData, TileData
+from game_libs.level.tilemap import (TilesetData, TilemapData, FixedParallaxData, TilemapParallaxData, TileData,
+                                    MASK_NEIGHBORS)
 from game_libs.level.entity import Player
 from game_libs.level.level import Level
-from game_libs.rendering.tilemap_renderer import TilemapRenderer, TileRenderer
+from game_libs.rendering.tilemap_renderer import (TilemapRenderer, TileRenderer,
+                                                  FixedParallaxRenderer, TilemapParallaxRenderer)
 from pygame_ui import (Frame, IconButton, Label, Menubar, Popup, Selector,
                        TabbedFrame, TextEntry, UIApp, UIWidget, DropdownList,
                        DualListToggle, Button, ListView)
@@ -35,48 +52,183 @@ display.init()
 display.set_mode((1, 1), NOFRAME)
 display.set_icon(pygame.image.load("icon.ico").convert())
 
-brush_icon = pygame.image.load("assets/Editor/brush.png")
-fill_icon = pygame.image.load("assets/Editor/fill.png")
-rect_icon = pygame.image.load("assets/Editor/rectangle.png")
-new_icon = pygame.image.load("assets/Editor/new.png")
-open_icon = pygame.image.load("assets/Editor/open.png")
-save_icon = pygame.image.load("assets/Editor/save.png")
-tilemap_icon = pygame.image.load("assets/Editor/tilemap.png")
-entity_icon = pygame.image.load("assets/Editor/entity.png")
-layer_icon = pygame.image.load("assets/Editor/layer.png")
+MAX_FPS: int = 60 # frame rate cap of the editor loop
+IDLE_WAIT_MS: int = 250 # longest sleep on the event queue when nothing changes
+DIRTY_AREA_RATIO: float = 0.3 # above this share of the screen, flip instead of updating dirty rects
+CANVAS_EVENTS = frozenset((MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP)) # events whose changes a MapCanvas reports
+JSON_ENCODER = JSONEncoder(ensure_ascii=False) # shared by format_json, dumps builds a new encoder per call
+SAVE_ERROR_EVENT: int = pygame.event.custom_type() # posted by the save writer thread when a file can't be written
+
+# Editor icons by file name, filled by get_icon
+ICONS: dict[str, pygame.Surface] = {}
+
+def get_icon(name: str) -> pygame.Surface:
+    """Editor icon assets/Editor/{name}.png, loaded and converted to the display pixel format on first use."""
+    if name not in ICONS:
+        ICONS[name] = pygame.image.load(f"assets/Editor/{name}.png").convert_alpha()
+    return ICONS[name]
 
 
 # ----- Utility Functions ----- #
-def inline_dict(value: dict) -> str:
-    """Format a dictionary into a single-line string for display."""
-    items = []
-    for k, v in value.items():
-        if isinstance(v, str):
-            v_str = f'"{v}"'
-        elif isinstance(v, dict):
-            v_str = inline_dict(v)
+def format_json(data: dict) -> str:
+    """Format a save file as JSON with one key per line and one line per item of nested lists."""
+    lines = []
+    encode = JSON_ENCODER.encode
+    for key, value in data.items():
+        if isinstance(value, np.ndarray):
+            text = format_grid(value, 1)
+        elif isinstance(value, list) and value and isinstance(value[0], (dict, list)):
+            text = "[\n" + ",\n".join("\t\t" + encode(item) for item in value) + "\n\t]"
         else:
-            v_str = str(v)
-        items.append(f'"{k}": {v_str}')
-    return "{" + ", ".join(items) + "}"
+            text = encode(value)
+        lines.append(f"\t{encode(key)}: {text}")
+    return "{\n" + ",\n".join(lines) + "\n}"
 
-def format_grid(grid: list[list[int]], indent_nb: int) -> str:
+def format_grid(grid: np.ndarray, indent_nb: int) -> str:
     """Format a 2D grid into a string for display."""
-    maxl = max(len(str(cell)) for row in grid for cell in row)
+    grid = np.asarray(grid)
+    # The widest cell is either the lowest or the highest value
+    maxl = max(len(str(int(grid.min()))), len(str(int(grid.max()))))
+    if _NUMBA_AVAILABLE:
+        return _format_grid_ascii(grid, indent_nb, maxl).tobytes().decode("ascii")
+    # A whole row is formatted by a single %-format call instead of one f-string per cell
+    row_fmt = "\t"*(indent_nb+1) + "[" + ", ".join([f"%{maxl}d"] * grid.shape[1]) + "]"
     return (
         "[\n" +
-        "\n".join(
-            "\t"*(indent_nb+1) + "[" + (", ").join(
-                f"{cell: >{maxl}}" for cell in row
-            ) + "]," for row in grid
-        )[:-1] +
-        "\n\t"*(indent_nb) + "]"
+        ",\n".join(row_fmt % tuple(row) for row in grid.tolist()) +
+        "\n" + "\t"*indent_nb + "]"
     )
 
+def cell_at(frame: Frame, pos: tuple[int, int], cell_size: int) -> tuple[int, int]:
+    """Return the cell of a scrolled frame under a screen position (may be out of its content)."""
+    left, top = frame.global_rect.topleft
+    scroll = frame.scroll
+    # Scroll steps are whole pixels, integer math avoids float and Vector2 work
+    return (pos[0] - left + int(scroll.x)) // cell_size, (pos[1] - top + int(scroll.y)) // cell_size
+
+@njit(cache=True)
+def _format_grid_ascii(grid: np.ndarray, indent_nb: int, maxl: int) -> np.ndarray:
+    """Write the format_grid text of grid as ASCII codes, cells right-aligned on maxl characters."""
+    height, width = grid.shape
+    row_len = (indent_nb + 1) + 1 + width * maxl + max(width - 1, 0) * 2 + 3
+    out = np.empty(2 + height * row_len + indent_nb + 1, np.uint8)
+    out[0] = 91 # [
+    out[1] = 10 # \n
+    k = 2
+    for y in range(height):
+        for _ in range(indent_nb + 1):
+            out[k] = 9 # \t
+            k += 1
+        out[k] = 91
+        k += 1
+        for x in range(width):
+            if x:
+                out[k] = 44 # ,
+                out[k + 1] = 32 # space
+                k += 2
+            # Digits are written from the right end of the cell, then the sign and the padding
+            v = int(grid[y, x])
+            negative = v < 0
+            if negative:
+                v = -v
+            p = k + maxl - 1
+            while True:
+                out[p] = 48 + v % 10
+                p -= 1
+                v //= 10
+                if v == 0:
+                    break
+            if negative:
+                out[p] = 45 # -
+                p -= 1
+            while p >= k:
+                out[p] = 32
+                p -= 1
+            k += maxl
+        out[k] = 93 # ]
+        k += 1
+        if y < height - 1:
+            out[k] = 44
+            k += 1
+        out[k] = 10
+        k += 1
+    for _ in range(indent_nb):
+        out[k] = 9
+        k += 1
+    out[k] = 93
+    k += 1
+    return out[:k]
+
+@njit(cache=True)
+def _flood_fill(grid: np.ndarray, x: int, y: int, target: int, replacement: int) -> tuple[int, int, int, int, int]:
+    """Replace the 4-connected region of target tiles around (x, y), return the filled count and its bounding cells."""
+    height, width = grid.shape
+    # Scanline fill: the stack holds one seed per horizontal run instead of one per cell
+    stack = [(x, y)]
+    filled = 0
+    x1, y1, x2, y2 = x, y, x, y
+    while stack:
+        sx, sy = stack.pop()
+        if grid[sy, sx] != target:
+            continue
+        lx = sx
+        while lx > 0 and grid[sy, lx - 1] == target:
+            lx -= 1
+        x1 = min(x1, lx)
+        y1 = min(y1, sy)
+        y2 = max(y2, sy)
+        span_above = False
+        span_below = False
+        while lx < width and grid[sy, lx] == target:
+            grid[sy, lx] = replacement
+            filled += 1
+            if sy > 0:
+                if grid[sy - 1, lx] == target:
+                    if not span_above:
+                        stack.append((lx, sy - 1))
+                        span_above = True
+                else:
+                    span_above = False
+            if sy < height - 1:
+                if grid[sy + 1, lx] == target:
+                    if not span_below:
+                        stack.append((lx, sy + 1))
+                        span_below = True
+                else:
+                    span_below = False
+            lx += 1
+        x2 = max(x2, lx - 1)
+    return filled, x1, y1, x2, y2
+
+@njit(cache=True)
+def _cull_entities(xy: np.ndarray, sx: float, sy: float, ts: int, w: int, h: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the indices of the positions xy seen in a w x h viewport scrolled by (sx, sy) and their viewport coords."""
+    n = xy.shape[0]
+    indices = np.empty(n, np.int64)
+    coords = np.empty((n, 2), np.int64)
+    k = 0
+    for i in range(n):
+        # Truncated toward zero like int()
+        px = int(xy[i, 0] - sx)
+        py = int(xy[i, 1] - sy)
+        if -ts < px < w and -ts < py < h:
+            indices[k] = i
+            coords[k, 0] = px
+            coords[k, 1] = py
+            k += 1
+    return indices[:k], coords[:k]
+
+if _NUMBA_AVAILABLE:
+    # Compile (or load from cache) at startup so the first fill or save doesn't stall the editor
+    _flood_fill(np.full((1, 1), -1, dtype=np.int16), 0, 0, -1, 0)
+    _format_grid_ascii(np.full((1, 1), -1, dtype=np.int16), 1, 2)
+    _cull_entities(np.zeros((1, 2)), 0.0, 0.0, 1, 1, 1)
+
 
 # ----- TilePicker Widget ----- #
 class TilePicker(Frame):
     """A tile picker widget to select tiles from a tileset."""
+    event_mask = frozenset((MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEWHEEL))
     
     def __init__(self, parent: Optional[UIWidget], rect: Rect, tilemap=None):
         super().__init__(parent, rect)
@@ -90,36 +242,38 @@ class TilePicker(Frame):
         return self.tilemap if self.tilemap is not None else self.app.level.tilemap
 
     def _update_size(self):
-        tilemap = self.get_tilemap()
-        tile_size = tilemap.tileset.tile_size
-        tiles_per_row = max(1, self.rect.width // tile_size)
-        n_tiles = len(tilemap.tileset.tiles)
-        n_rows = (n_tiles + tiles_per_row - 1) // tiles_per_row
-        self.size = (self.rect.width, max(self.rect.height, n_rows * tile_size))
-        self.surface = pygame.Surface(self.size, SRCALPHA)
+        # Resolved here so event handling reads plain attributes instead of the tilemap chain
+        tileset = self.get_tilemap().tileset
+        if tileset is not getattr(self, "_tileset", tileset):
+            # Indexes picked in the previous tileset mean nothing in the new one
+            self.selected = -1
+            self.hovered = -1
+        self._tileset: TilesetData = tileset
+        self._tile_size: int = self._tileset.tile_size
+        self._tiles_per_row: int = max(1, self.rect.width // self._tile_size)
+        self._n_tiles: int = len(self._tileset.tiles)
+        n_rows = (self._n_tiles + self._tiles_per_row - 1) // self._tiles_per_row
+        # The size setter only reallocates the surface when the size changes
+        self.size = (self.rect.width, max(self.rect.height, n_rows * self._tile_size))
+
+    def _tile_index(self, pos: tuple[int, int]) -> int:
+        """Index of the tile under a screen position (may be out of the tileset)."""
+        x, y = cell_at(self, pos, self._tile_size)
+        return y * self._tiles_per_row + x
 
     def handle_event(self, event):
         if not self.displayed:
             return False
         
-        tilemap = self.get_tilemap()
-        tile_size = tilemap.tileset.tile_size
-        tiles_per_row = max(1, self.rect.width // tile_size)
-        n_tiles = len(tilemap.tileset.tiles)
+        n_tiles = self._n_tiles
 
         if self.hover and event.type == pygame.MOUSEMOTION:
-            pos = Vector2(event.pos) - Vector2(self.global_rect.topleft) + self.scroll
-            x = int(pos.x // tile_size)
-            y = int(pos.y // tile_size)
-            idx = int(y * tiles_per_row + x)
+            idx = self._tile_index(event.pos)
             self.hovered = idx if 0 <= idx < n_tiles else -1
             return True
         
         if self.focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
-            pos = Vector2(event.pos) - Vector2(self.global_rect.topleft) + self.scroll
-            x = int(pos.x // tile_size)
-            y = int(pos.y // tile_size)
-            idx = int(y * tiles_per_row + x)
+            idx = self._tile_index(event.pos)
             if 0 <= idx < n_tiles:
                 self.selected = idx
                 self.logger.text = f"Selected tile {self.selected}"
@@ -131,25 +285,28 @@ class TilePicker(Frame):
         if not self.displayed:
             return
         
-        tilemap = self.get_tilemap()
-        tile_size = tilemap.tileset.tile_size
-        tiles_per_row = max(1, self.rect.width // tile_size)
-        
         self._update_size()
-        self.surface.fill(self.app.theme.colors["bg"])
-
-        for idx, tile in enumerate(tilemap.tileset.tiles):
-            x = (idx % tiles_per_row) * tile_size
-            y = (idx // tiles_per_row) * tile_size
-            self.surface.blit(TileRenderer.render(tile, [False]*8), (x, y))
-            rect_tile = pygame.Rect(x, y, tile_size, tile_size)
-            if idx == self.selected:
-                pygame.draw.rect(self.surface, self.app.theme.colors["accent"], rect_tile, 2)
-            elif idx == self.hovered:
-                pygame.draw.rect(self.surface, self.app.theme.colors["hover"], rect_tile, 2)
+        tileset = self._tileset
+        tile_size = self._tile_size
+        tiles_per_row = self._tiles_per_row
+        colors = self.app.theme.colors
+
+        self.surface.fill(colors["bg"])
+        self.surface.blit(AssetsRegistry.get_atlas(tileset, tiles_per_row), (0, 0))
+
+        if self.hovered not in (-1, self.selected):
+            rect_tile = Rect((self.hovered % tiles_per_row) * tile_size,
+                             (self.hovered // tiles_per_row) * tile_size,
+                             tile_size, tile_size)
+            pygame.draw.rect(self.surface, colors["hover"], rect_tile, 2)
+        if self.selected != -1:
+            rect_tile = Rect((self.selected % tiles_per_row) * tile_size,
+                             (self.selected // tiles_per_row) * tile_size,
+                             tile_size, tile_size)
+            pygame.draw.rect(self.surface, colors["accent"], rect_tile, 2)
 
         surface_rect = Rect(self.scroll, self.rect.size)
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
+        surface.blit(self.surface, self.rect, surface_rect)
         self.draw_scrollbars(surface)
         pygame.draw.rect(surface, (0, 0, 0), self.rect.inflate(2, 2), 2)
 
@@ -157,26 +314,28 @@ class TilePicker(Frame):
 # ----- MapCanvas Widget ----- #
 class MapCanvas(Frame):
     """A map canvas widget to display and edit a tilemap."""
+    event_mask = frozenset((MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL))
     
     def __init__(self, parent: Optional[UIWidget], rect: Rect, tilemap=None):
         Frame.__init__(self, parent, rect)
         self.logger = self.app.label_info
         self.tilemap = tilemap
-        tm = self.get_tilemap()
-        width = tm.width * tm.tileset.tile_size
-        height = tm.height * tm.tileset.tile_size
-        self.size = (width, height)
+        self.reinit()
         
         self.tile_picker: Optional[TilePicker] = None
         self.tool_selector: Selector = self.app.tools_selector
         self.painting: bool = False
         self.erasing: bool = False
         self.estimating_rect: bool = False
-        self.rect_start: Optional[Vector2] = None
+        self.rect_start: Optional[tuple[int, int]] = None
         
-        # Cached surfaces for viewport rendering
-        self._tilemap_cache = None
-        self._cache_camera_pos = None
+        # Last cell touched by the brush or eraser, moves inside it are skipped
+        self._last_paint: tuple[int, int] = (-1, -1)
+        # Reused every frame, only reallocated when the viewport is resized
+        self._viewport_surface: Optional[pygame.Surface] = None
+        # Screen areas changed by edits and highlighter moves, the editor loop presents and clears them
+        self.dirty_rects: list[Rect] = []
+        self._highlight: Optional[Rect] = None
 
     def get_tilemap(self):
         return self.tilemap if self.tilemap is not None else self.app.level.tilemap
@@ -184,12 +343,14 @@ class MapCanvas(Frame):
     def reinit(self):
         """Reinitialize the canvas."""
         tm = self.get_tilemap()
-        width = tm.width * tm.tileset.tile_size
-        height = tm.height * tm.tileset.tile_size
-        self.size = (width, height)
-        self._tilemap_cache = None
-        self._cache_camera_pos = None
-        TilemapRenderer.clear_cache()
+        # Resolved once, tilemap or tileset switches rebuild the canvas (or call reinit)
+        self._tile_size: int = tm.tileset.tile_size
+        self._map_size: tuple[int, int] = (tm.width, tm.height)
+        self._grid: np.ndarray = tm.grid
+        self.size = (tm.width * self._tile_size, tm.height * self._tile_size)
+        # _dirty drops the cached render of the tilemap (new canvas), edits invalidate
+        # the tiles or chunks they touch right away so every canvas sees them
+        self._dirty: bool = True
 
     @property
     def viewport_camera(self) -> Camera:
@@ -197,109 +358,140 @@ class MapCanvas(Frame):
         center = self.scroll + Vector2(self.rect.width // 2, self.rect.height // 2)
         return Camera(center, (self.rect.width, self.rect.height))
 
+    def _screen_to_tile(self, pos: tuple[int, int]) -> tuple[int, int, bool]:
+        """Convert a screen position to tile coordinates, and tell if it lies on the tilemap."""
+        x, y = cell_at(self, pos, self._tile_size)
+        width, height = self._map_size
+        return x, y, 0 <= x < width and 0 <= y < height
+
+    def _cells_rect(self, x1: int, y1: int, x2: int, y2: int) -> Rect:
+        """Rect on the parent surface of the cells from (x1, y1) to (x2, y2) included."""
+        tile_size = self._tile_size
+        return Rect(
+            x1 * tile_size - int(self.scroll.x) + self.rect.left,
+            y1 * tile_size - int(self.scroll.y) + self.rect.top,
+            (x2 - x1 + 1) * tile_size,
+            (y2 - y1 + 1) * tile_size
+        )
+
+    def _to_screen(self, rect: Rect) -> Rect:
+        """Move a rect drawn on the parent surface to screen coordinates."""
+        gx, gy = self.global_rect.topleft
+        return rect.move(gx - self.rect.left, gy - self.rect.top)
+
+    def _report_cells(self, x1: int, y1: int, x2: int, y2: int):
+        """Add the edited cells, their autotile neighbors and the minimap to the dirty rects."""
+        cells = self._cells_rect(x1 - 1, y1 - 1, x2 + 1, y2 + 1).clip(self.rect)
+        self.dirty_rects.append(self._to_screen(cells))
+        self.dirty_rects.append(self.app.minimap.rect.inflate(2, 2))
+
+    def _selected_tile(self) -> int:
+        """Tile selected in the tile picker, -1 if none or out of the tileset of the tilemap."""
+        selected = self.tile_picker.selected if self.tile_picker else -1
+        return selected if 0 <= selected < len(self.get_tilemap().tileset.tiles) else -1
+
+    def _mark_minimap(self, x: Optional[int] = None, y: Optional[int] = None):
+        """Flag the minimap after an edit, per tile only for the main tilemap it draws."""
+        if self.get_tilemap() is self.app.level.tilemap:
+            self.app.minimap.mark_dirty(x, y)
+        else:
+            self.app.minimap.mark_dirty()
+
     def fill(self, event: pygame.event.Event):
         """Fill a tile region with selected tile."""
         if self.tool_selector.selected_name != "fill":
             return
         
-        tm = self.get_tilemap()
-        mouse_pos = Vector2(event.pos)
-        x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-        y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-        
-        if 0 <= x < tm.width and 0 <= y < tm.height:
-            target_tile = tm.grid[y][x]
-            replacement_tile = self.tile_picker.selected if self.tile_picker else -1
+        x, y, inside = self._screen_to_tile(event.pos)
+
+        if inside:
+            target_tile = int(self._grid[y, x])
+            replacement_tile = self._selected_tile()
             if target_tile == replacement_tile or replacement_tile == -1:
                 return
-            
-            to_fill = [(x, y)]
-            filled = set()
-            while to_fill:
-                cx, cy = to_fill.pop()
-                if (cx, cy) in filled:
-                    continue
-                current_tile = tm.grid[cy][cx]
-                if current_tile == target_tile:
-                    tm.grid[cy][cx] = replacement_tile
-                    filled.add((cx, cy))
-                    if cx > 0:
-                        to_fill.append((cx - 1, cy))
-                    if cx < tm.width - 1:
-                        to_fill.append((cx + 1, cy))
-                    if cy > 0:
-                        to_fill.append((cx, cy - 1))
-                    if cy < tm.height - 1:
-                        to_fill.append((cx, cy + 1))
-            
-            self.logger.text = f"Filled {len(filled)} tiles"
-            self._tilemap_cache = None  # Invalidate cache
+
+            filled, x1, y1, x2, y2 = _flood_fill(self._grid, x, y, target_tile, replacement_tile)
+
+            self.logger.text = f"Filled {filled} tiles"
+            TilemapRenderer.invalidate_area(self.get_tilemap(), x1, y1, x2, y2)
+            self._report_cells(x1, y1, x2, y2)
+            self.dirty_rects.append((self.logger.parent or self.logger).global_rect)
+
+    def _paint_line(self, x: int, y: int, tile: int):
+        """Set tile on the cells from the last painted one to (x, y), fast drags skip no cell."""
+        x0, y0 = self._last_paint
+        if x0 == -1:
+            x0, y0 = x, y
+        n = max(abs(x - x0), abs(y - y0)) + 1
+        xs = np.rint(np.linspace(x0, x, n)).astype(np.intp)
+        ys = np.rint(np.linspace(y0, y, n)).astype(np.intp)
+        changed = self._grid[ys, xs] != tile
+        if not changed.any():
+            return
+        xs, ys = xs[changed], ys[changed]
+        self._grid[ys, xs] = tile
+        self._report_cells(int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max()))
+        cells = list(zip(xs.tolist(), ys.tolist()))
+        TilemapRenderer.invalidate_tiles(self.get_tilemap(), cells)
+        for cell in cells:
+            self._mark_minimap(*cell)
 
     def handle_event(self, event: pygame.event.Event):
         if not self.displayed:
             return False
         
-        tm = self.get_tilemap()
-        
-        if self.focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
-            if self.tool_selector.selected_name == "brush":
+        grid = self._grid
+        # Mouse events carry their position, the others use the current cursor
+        x, y, inside = self._screen_to_tile(getattr(event, "pos", None) or pygame.mouse.get_pos())
+        focus = self.focus
+        tool = self.tool_selector.selected_name
+        selected = self._selected_tile()
+
+        if focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
+            if tool == "brush":
                 self.painting = True
-            elif self.tool_selector.selected_name == "fill":
+            elif tool == "fill":
                 self.fill(event)
-                self.app.minimap.update_minimap()
-            elif self.tool_selector.selected_name == "rect":
-                mouse_pos = Vector2(event.pos)
-                x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-                y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-                if 0 <= x < tm.width and 0 <= y < tm.height:
+                self._mark_minimap()
+            elif tool == "rect":
+                if inside:
                     self.estimating_rect = True
-                    self.rect_start = Vector2(x, y)
+                    self.rect_start = (x, y)
         
-        if self.focus and event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
+        if focus and event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
             self.erasing = True
 
-        if self.focus and event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            self.painting = False
+        if focus and event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            if self.painting:
+                self.painting = False
+                self._last_paint = (-1, -1)
             if self.estimating_rect and self.rect_start is not None:
-                mouse_pos = Vector2(event.pos)
-                x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-                y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-                if 0 <= x < tm.width and 0 <= y < tm.height:
-                    x1 = int(min(self.rect_start.x, x))
-                    x2 = int(max(self.rect_start.x, x))
-                    y1 = int(min(self.rect_start.y, y))
-                    y2 = int(max(self.rect_start.y, y))
-                    if self.tile_picker and self.tile_picker.selected != -1:
-                        for iy in range(y1, y2 + 1):
-                            for ix in range(x1, x2 + 1):
-                                tm.grid[iy][ix] = self.tile_picker.selected
+                if inside:
+                    sx, sy = self.rect_start
+                    x1, x2 = min(sx, x), max(sx, x)
+                    y1, y2 = min(sy, y), max(sy, y)
+                    if selected != -1:
+                        grid[y1:y2 + 1, x1:x2 + 1] = selected
+                        TilemapRenderer.invalidate_area(self.get_tilemap(), x1, y1, x2, y2)
+                        self._report_cells(x1, y1, x2, y2)
+                        self._mark_minimap()
                 self.estimating_rect = False
                 self.rect_start = None
-                self._tilemap_cache = None
-                self.app.minimap.update_minimap()
-
-        if self.focus and event.type == pygame.MOUSEBUTTONUP and event.button == 3:
-            self.erasing = False
-
-        if self.painting:
-            mouse_pos = Vector2(pygame.mouse.get_pos())
-            x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-            y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-            if 0 <= x < tm.width and 0 <= y < tm.height:
-                if self.tile_picker and self.tile_picker.selected != -1 and tm.grid[y][x] != self.tile_picker.selected:
-                    tm.grid[y][x] = self.tile_picker.selected
-                    self._tilemap_cache = None
-            self.app.minimap.update_minimap()
-
-        if self.erasing:
-            mouse_pos = Vector2(pygame.mouse.get_pos())
-            x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-            y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-            if 0 <= x < tm.width and 0 <= y < tm.height:
-                if tm.grid[y][x] != -1:
-                    tm.grid[y][x] = -1
-                    self._tilemap_cache = None
-            self.app.minimap.update_minimap()
+
+        if focus and event.type == pygame.MOUSEBUTTONUP and event.button == 3:
+            if self.erasing:
+                self.erasing = False
+                self._last_paint = (-1, -1)
+
+        if (self.painting or self.erasing) and not inside:
+            # Leaving the map ends the stroke, re-entering must not draw a line across
+            self._last_paint = (-1, -1)
+        elif (self.painting or self.erasing) and (x, y) != self._last_paint:
+            if self.painting and selected != -1:
+                self._paint_line(x, y, selected)
+            if self.erasing:
+                self._paint_line(x, y, -1)
+            self._last_paint = (x, y)
         
         return super().handle_event(event)
 
@@ -309,52 +501,40 @@ class MapCanvas(Frame):
         
         tm = self.get_tilemap()
         
-        # Create a viewport-sized surface
-        viewport_surface = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA)
-        viewport_surface.fill((0, 0, 0, 0))
-        
-        TilemapRenderer.clear_cache()
-        
-        # Create camera for this viewport
-        camera = self.viewport_camera
-        TilemapRenderer.render(tm, viewport_surface, camera, camera)
+        # Clear the viewport-sized surface (recreated only on resize)
+        viewport_surface = self._viewport_surface
+        if viewport_surface is None or viewport_surface.get_size() != self.rect.size:
+            viewport_surface = self._viewport_surface = pygame.Surface(self.rect.size, SRCALPHA)
+        else:
+            viewport_surface.fill((0, 0, 0, 0))
+
+        if self._dirty:
+            TilemapRenderer.invalidate(tm)
+            self._dirty = False
+
+        # Render with the camera of this viewport
+        TilemapRenderer.render(tm, viewport_surface, self.viewport_camera)
         
         # Blit the viewport directly to the destination
         surface.blit(viewport_surface, self.rect.topleft)
 
         # Draw tile highlighter
-        if self.estimating_rect and self.rect_start is not None:
-            mouse_pos = Vector2(pygame.mouse.get_pos())
-            x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-            y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-            if 0 <= x < tm.width and 0 <= y < tm.height:
-                x1 = min(int(self.rect_start.x), x)
-                x2 = max(int(self.rect_start.x), x)
-                y1 = min(int(self.rect_start.y), y)
-                y2 = max(int(self.rect_start.y), y)
-                pygame.draw.rect(
-                    surface,
-                    self.app.theme.colors["accent"],
-                    Rect(
-                        Vector2(x1, y1) * tm.tileset.tile_size - self.scroll + Vector2(self.rect.topleft),
-                        ((x2 - x1 + 1) * tm.tileset.tile_size, (y2 - y1 + 1) * tm.tileset.tile_size)
-                    ),
-                    2
-                )
-        else:
-            mouse_pos = Vector2(pygame.mouse.get_pos())
-            x = int((mouse_pos.x - self.global_rect.left + self.scroll.x) // tm.tileset.tile_size)
-            y = int((mouse_pos.y - self.global_rect.top + self.scroll.y) // tm.tileset.tile_size)
-            if 0 <= x < tm.width and 0 <= y < tm.height:
-                pygame.draw.rect(
-                    surface,
-                    self.app.theme.colors["accent"],
-                    Rect(
-                        Vector2(x, y) * tm.tileset.tile_size - self.scroll + Vector2(self.rect.topleft),
-                        (tm.tileset.tile_size, tm.tileset.tile_size)
-                    ),
-                    2
-                )
+        x, y, inside = self._screen_to_tile(pygame.mouse.get_pos())
+        highlight = None
+        if inside:
+            if self.estimating_rect and self.rect_start is not None:
+                sx, sy = self.rect_start
+                x1, x2 = min(sx, x), max(sx, x)
+                y1, y2 = min(sy, y), max(sy, y)
+            else:
+                x1 = x2 = x
+                y1 = y2 = y
+            highlight = self._cells_rect(x1, y1, x2, y2)
+            pygame.draw.rect(surface, self.app.theme.colors["accent"], highlight, 2)
+        if highlight != self._highlight and self.focus:
+            # Old and new outlines both need presenting
+            self.dirty_rects.extend(self._to_screen(r) for r in (self._highlight, highlight) if r is not None)
+        self._highlight = highlight
 
         self.draw_scrollbars(surface)
 
@@ -362,6 +542,7 @@ class MapCanvas(Frame):
 # ----- Tile Properties Editor ----- #
 class TilePropertiesEditor(Frame):
     """A properties editor for tiles."""
+    event_mask = frozenset((KEYDOWN, MOUSEBUTTONDOWN, MOUSEWHEEL))
     
     def __init__(self, parent: Optional[UIWidget], rect: Rect):
         super().__init__(parent, rect)
@@ -388,7 +569,12 @@ class TilePropertiesEditor(Frame):
                     bitmask = self.bitmask_editor.text
                     if bitmask not in ["unique", "field", "fall", "wall"]:
                         raise ValueError()
-                    tile.autotilebitmask = bitmask
+                    if bitmask != tile.autotilebitmask:
+                        # Rendered tiles are cached per tile and neighborhood, not per bitmask
+                        tile.autotilebitmask = bitmask
+                        TileRenderer.clear_cache()
+                        TilemapRenderer.clear_cache()
+                        AssetsRegistry.clear_atlases()
                     self.logger.text = f"Set bitmask of tile {self.selected_tile} to {bitmask}"
                 except ValueError:
                     self.logger.text = "Error: Invalid bitmask value"
@@ -397,6 +583,7 @@ class TilePropertiesEditor(Frame):
                     if hitbox not in [0, 1]:
                         raise ValueError()
                     tile.hitbox = hitbox
+                    self.app.level.tilemap.tileset.refresh_tables()
                     self.logger.text = f"Set hitbox to {hitbox}"
                 except ValueError:
                     self.logger.text = "Error: Hitbox must be 0 or 1"
@@ -424,6 +611,41 @@ class TilePropertiesEditor(Frame):
 
 
 # ----- LayerPicker ----- #
+def sync_layer_frames(tabbed: TabbedFrame,
+                      names: list[str],
+                      make_frame: Callable[[int], Frame],
+                      added: bool = False,
+                      removed: Optional[int] = None,
+                      swapped: Optional[tuple[int, int]] = None,
+                      rebuild_moved: bool = False,
+                      reuse_frame: Optional[Callable[[int], Optional[Frame]]] = None) -> None:
+    """Apply a layer list change to a TabbedFrame keyed by layer names, only building the changed frames."""
+    frames = list(tabbed.frames.values())
+    for name in list(tabbed.frames):
+        tabbed.detach(name)
+    moved: list[int] = []
+    if removed is not None:
+        frames.pop(removed)
+        moved = list(range(removed, len(frames)))
+    elif swapped is not None:
+        a, b = swapped
+        frames[a], frames[b] = frames[b], frames[a]
+        moved = [a, b]
+    elif added:
+        frames.append(make_frame(len(frames)))
+    else:
+        # Without change info, reuse_frame may still hand back the frame of an unchanged layer
+        frames = [(reuse_frame and reuse_frame(i)) or make_frame(i) for i in range(len(names))]
+    if rebuild_moved:
+        # Frames showing their layer name are rebuilt when their index changes
+        for i in moved:
+            frames[i] = make_frame(i)
+    for name, frame in zip(names, frames):
+        if frame not in tabbed.children:
+            tabbed.children.append(frame)
+        tabbed.attach(name, frame)
+
+
 class LayerPicker(Frame):
     """
     Liste des layers (tilemap principale + parallax) avec gestion ajout/suppression/déplacement.
@@ -438,6 +660,8 @@ class LayerPicker(Frame):
         
         # TabbedFrame pour les TilePicker / vide
         self.tilepickers = TabbedFrame(self, Rect(0, rect.height-300, rect.width, 300), self.listview)
+        # Layer objects the tile pickers were built for, in listview order
+        self._layers: list = []
         self.refresh()
 
         # Boutons
@@ -451,45 +675,54 @@ class LayerPicker(Frame):
         names += [f"Parallax {i+1}" for i in range(len(self.app.level.tilemap.parallax or []))]
         return names
 
-    def refresh(self):
+    def get_layers(self) -> list:
+        """Layer objects in listview order: the main tilemap then its parallax."""
+        return [self.app.level.tilemap, *(self.app.level.tilemap.parallax or [])]
+
+    def reuse_tilepicker(self, index: int, frames: dict[int, Frame]) -> Optional[Frame]:
+        """Tile picker built for the layer at index before a full refresh, if any."""
+        frame = frames.get(id(self._layers[index]))
+        if isinstance(frame, TilePicker):
+            # The tileset of the layer may have changed
+            frame._update_size()
+        return frame
+
+    def make_tilepicker(self, index: int) -> Frame:
+        """Create the tile picker of the layer at index (an empty frame for static parallax)."""
+        rect = Rect(0, 0, self.tilepickers.rect.width, self.tilepickers.rect.height)
+        if index == 0:
+            return TilePicker(self.tilepickers, rect)
+        parallax = self.app.level.tilemap.parallax[index-1]
+        if hasattr(parallax, "tm"):  # À adapter selon ta structure
+            return TilePicker(self.tilepickers, rect, tilemap=parallax.tm)
+        return Frame(self.tilepickers, rect)  # Vide
+
+    def refresh(self,
+                added: bool = False,
+                removed: Optional[int] = None,
+                swapped: Optional[tuple[int, int]] = None):
+        """
+        Refresh the layers, without change info every frame is rebuilt.
+        added: a layer was appended, removed: index of the removed layer,
+        swapped: indexes of the two exchanged layers.
+        """
         old_index = self.listview.selected_index
         self.listview.items = self.get_layer_names()
         self.listview.selected_index = min(old_index, len(self.listview.items) - 1)
 
-        self.tilepickers.frames.clear()
-        # Tilemap principale
-        self.tilepickers.attach(
-            "Tilemap principale",
-            TilePicker(self.tilepickers,
-                       Rect(0, 0, self.tilepickers.rect.width, self.tilepickers.rect.height))
-            )
-        # Parallax
-        for i, parallax in enumerate(self.app.level.tilemap.parallax or []):
-            if hasattr(parallax, "tm"):  # À adapter selon ta structure
-                self.tilepickers.attach(
-                    f"Parallax {i+1}",
-                    TilePicker(self.tilepickers,
-                               Rect(0,
-                                    0,
-                                    self.tilepickers.rect.width,
-                                    self.tilepickers.rect.height),
-                               tilemap=parallax.tm)
-                    )
-            else:
-                self.tilepickers.attach(
-                    f"Parallax {i+1}",
-                    Frame(self.tilepickers,
-                          Rect(0,
-                               0,
-                               self.tilepickers.rect.width,
-                               self.tilepickers.rect.height))
-                    )  # Vide
+        # Frames by layer object, old_layers keeps the objects alive so their ids stay unique
+        old_layers = self._layers
+        old_frames = {id(layer): frame for layer, frame in zip(old_layers, self.tilepickers.frames.values())}
+        self._layers = self.get_layers()
+        sync_layer_frames(self.tilepickers, self.listview.items, self.make_tilepicker,
+                          added, removed, swapped,
+                          reuse_frame=lambda i: self.reuse_tilepicker(i, old_frames))
         if hasattr(self.app, "layer_properties"):
-            self.app.layer_properties.refresh()
+            self.app.layer_properties.refresh(added, removed, swapped)
         if hasattr(self.app, "layer_canvas"):
-            self.app.layer_canvas.refresh()
+            self.app.layer_canvas.refresh(added, removed, swapped)
         if hasattr(self.app, "minimap"):
-            self.app.minimap.update_minimap()
+            self.app.minimap.invalidate_parallax()
 
     def add_layer(self):
         # Popup pour choisir le type de parallax et ses propriétés
@@ -497,7 +730,7 @@ class LayerPicker(Frame):
         popup.rect.center = self.app.screen.get_rect().center
 
         # Selector + TabbedFrame pour le type de parallax
-        type_selector = Selector(popup, (10, 10), {"Statique": rect_icon, "Tilemap": layer_icon})
+        type_selector = Selector(popup, (10, 10), {"Statique": get_icon("rectangle"), "Tilemap": get_icon("layer")})
         tabbed = TabbedFrame(popup, Rect(50, 100, 400, 250), selector=type_selector)
 
         # Frame pour Statique
@@ -546,11 +779,11 @@ class LayerPicker(Frame):
                 width = int(width_entry.text or "40")
                 height = int(height_entry.text or "23")
                 tileset_obj = AssetsRegistry.load_tileset(tileset.get_text())
-                tilemap = TilemapData(name, width, height, tileset_obj, "", "", [[-1 for _ in range(width)] for _ in range(height)], [], [])
+                tilemap = TilemapData(name, width, height, tileset_obj, "", "", np.full((height, width), -1, dtype=np.int16), [], [])
                 parallax = TilemapParallaxData(tm=tilemap, blueprint={"type": "tilemap", "name": tilemap.name})
                 self.logger.text = f"Create tilemap parallax with tilemap {name} ({width}x{height})"
             self.app.level.tilemap.parallax.append(parallax)
-            self.refresh()
+            self.refresh(added=True)
 
     def remove_layer(self):
         idx = self.listview.selected_index
@@ -558,7 +791,7 @@ class LayerPicker(Frame):
             self.app.label_info.text = "Impossible de supprimer la tilemap principale"
             return
         del self.app.level.tilemap.parallax[idx-1]
-        self.refresh()
+        self.refresh(removed=idx)
 
     def move_up(self):
         idx = self.listview.selected_index
@@ -567,7 +800,7 @@ class LayerPicker(Frame):
         parallax = self.app.level.tilemap.parallax
         parallax[idx-2], parallax[idx-1] = parallax[idx-1], parallax[idx-2]
         self.listview.selected_index -= 1
-        self.refresh()
+        self.refresh(swapped=(idx-1, idx))
 
     def move_down(self):
         idx = self.listview.selected_index
@@ -576,7 +809,7 @@ class LayerPicker(Frame):
             return
         parallax[idx-1], parallax[idx] = parallax[idx], parallax[idx-1]
         self.listview.selected_index += 1
-        self.refresh()
+        self.refresh(swapped=(idx, idx+1))
 
 
 # ----- Layer Properties ----- #
@@ -590,37 +823,59 @@ class LayerProperties(Frame):
         self.frame = TabbedFrame(self, Rect(0, 0, rect.width, rect.height), self.app.layerpicker.listview)
         self.refresh()
 
-    def refresh(self):
+    def make_properties(self, index: int) -> Frame:
+        """Create the properties frame of the layer at index."""
+        frame = Frame(self.frame, Rect(0, 0, self.frame.rect.width, self.frame.rect.height))
+        if index == 0:
+            tilemap = self.app.level.tilemap
+            Label(frame, (10, 10), "Tilemap Properties")
+            Label(frame, (10, 50), f"Size: {tilemap.width} x {tilemap.height}")
+            Label(frame, (10, 90), f"Tileset: {tilemap.tileset.name}")
+            Label(frame, (10, 130), f"BGM: {tilemap.bgm if tilemap.bgm else 'None'}")
+            Label(frame, (10, 170), f"BGS: {tilemap.bgs if tilemap.bgs else 'None'}")
+        else:
+            parallax = self.app.level.tilemap.parallax[index-1]
+            Label(frame, (10, 10), f"Parallax {index} Properties")
+            if hasattr(parallax, "img"):
+                Label(frame, (10, 50), "Type: Static")
+                Label(frame, (10, 90), f"Image: {parallax.img}")
+            elif hasattr(parallax, "tm"):
+                tm = parallax.tm
+                Label(frame, (10, 50), "Type: Tilemap")
+                Label(frame, (10, 90), f"Size: {tm.width} x {tm.height}")
+                Label(frame, (10, 130), f"Tileset: {tm.tileset.name}")
+            else:
+                Label(frame, (10, 50), "Unknown Parallax Type")
+        return frame
+
+    def refresh(self,
+                added: bool = False,
+                removed: Optional[int] = None,
+                swapped: Optional[tuple[int, int]] = None):
         """
         Refresh the properties display based on the selected layer.
         """
-        self.frame.frames.clear()
-        for layer in self.app.layerpicker.listview.items:
-            if layer == "Tilemap principale":
-                tilemap = self.app.level.tilemap
-                frame = Frame(self.frame, Rect(0, 0, self.frame.rect.width, self.frame.rect.height))
-                Label(frame, (10, 10), "Tilemap Properties")
-                Label(frame, (10, 50), f"Size: {tilemap.width} x {tilemap.height}")
-                Label(frame, (10, 90), f"Tileset: {tilemap.tileset.name}")
-                Label(frame, (10, 130), f"BGM: {tilemap.bgm if tilemap.bgm else 'None'}")
-                Label(frame, (10, 170), f"BGS: {tilemap.bgs if tilemap.bgs else 'None'}")
-                self.frame.attach(layer, frame)
-            else:
-                idx = int(layer.split()[-1]) - 1
-                parallax = self.app.level.tilemap.parallax[idx]
-                frame = Frame(self.frame, Rect(0, 0, self.frame.rect.width, self.frame.rect.height))
-                Label(frame, (10, 10), f"{layer} Properties")
-                if hasattr(parallax, "img"):
-                    Label(frame, (10, 50), "Type: Static")
-                    Label(frame, (10, 90), f"Image: {parallax.img}")
-                elif hasattr(parallax, "tm"):
-                    tm = parallax.tm
-                    Label(frame, (10, 50), "Type: Tilemap")
-                    Label(frame, (10, 90), f"Size: {tm.width} x {tm.height}")
-                    Label(frame, (10, 130), f"Tileset: {tm.tileset.name}")
-                else:
-                    Label(frame, (10, 50), "Unknown Parallax Type")
-                self.frame.attach(layer, frame)
+        sync_layer_frames(self.frame, self.app.layerpicker.listview.items, self.make_properties,
+                          added, removed, swapped, rebuild_moved=True)
+
+
+# ----- Parallax Preview ----- #
+class ParallaxPreview(UIWidget):
+    """Display a static parallax image, scaled once to fit the widget."""
+    
+    def __init__(self, parent: Optional[UIWidget], rect: Rect, parallax: FixedParallaxData):
+        super().__init__(parent, rect)
+        self.parallax = parallax
+        image = FixedParallaxRenderer.render(parallax)
+        width, height = image.get_size()
+        scale = min(rect.width / width, rect.height / height) if width and height else 0
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        # The layers are rebuilt when the level changes, so the scaled image never needs invalidation
+        self.image = pygame.transform.scale(image, size).convert_alpha()
+        self.image_pos = (rect.x + (rect.width - size[0]) // 2, rect.y + (rect.height - size[1]) // 2)
+
+    def render(self, surface: pygame.Surface) -> None:
+        surface.blit(self.image, self.image_pos)
 
 
 # ----- LayerCanvas ----- #
@@ -631,6 +886,8 @@ class LayerCanvas(Frame):
     def __init__(self, parent: Optional[UIWidget], rect: Rect):
         super().__init__(parent, rect)
         self.tabbed = None
+        # Layer objects the canvases were built for, in listview order
+        self._layers: list = []
         
     def initialize(self):
         """Initialize tabbed frame after layerpicker is created."""
@@ -638,34 +895,53 @@ class LayerCanvas(Frame):
             self.tabbed = TabbedFrame(self, Rect(0, 0, self.rect.width, self.rect.height), self.app.layerpicker.listview)
             self.refresh()
         
-    def refresh(self):
+    def make_canvas(self, index: int) -> Frame:
+        """Create the canvas of the layer at index, bound to its tile picker."""
+        rect = Rect(0, 0, self.tabbed.rect.width, self.tabbed.rect.height)
+        tile_picker = list(self.app.layerpicker.tilepickers.frames.values())[index]
+        if index == 0:
+            canvas = MapCanvas(self.tabbed, rect, tilemap=self.app.level.tilemap)
+            canvas.tile_picker = tile_picker
+            return canvas
+        parallax = self.app.level.tilemap.parallax[index-1]
+        if hasattr(parallax, "tm"):
+            canvas = MapCanvas(self.tabbed, rect, tilemap=parallax.tm)
+            canvas.tile_picker = tile_picker
+            return canvas
+        frame = Frame(self.tabbed, rect)
+        ParallaxPreview(frame, Rect(rect), parallax)
+        Label(frame, (10, 10), "No canvas for static parallax")
+        return frame
+
+    def reuse_canvas(self, index: int, frames: dict[int, Frame]) -> Optional[Frame]:
+        """Canvas built for the layer at index before a full refresh, if any."""
+        frame = frames.get(id(self._layers[index]))
+        if isinstance(frame, MapCanvas):
+            # The tilemap may have been resized or given another tileset, and its tile picker rebuilt
+            frame.reinit()
+            frame.scroll.x = min(frame.scroll.x, max(0, frame.size[0] - frame.rect.width))
+            frame.scroll.y = min(frame.scroll.y, max(0, frame.size[1] - frame.rect.height))
+            frame.tile_picker = list(self.app.layerpicker.tilepickers.frames.values())[index]
+        return frame
+
+    def refresh(self,
+                added: bool = False,
+                removed: Optional[int] = None,
+                swapped: Optional[tuple[int, int]] = None):
         """
         Refresh the canvases based on the selected layer.
         """
         if self.tabbed is None:
+            # initialize already builds every canvas
             self.initialize()
-        
-        self.tabbed.frames.clear()
-        self.tabbed.children.clear()
-        for layer in self.app.layerpicker.listview.items:
-            if layer == "Tilemap principale":
-                tilemap = self.app.level.tilemap
-                canvas = MapCanvas(self.tabbed, Rect(0, 0, self.tabbed.rect.width, self.tabbed.rect.height), tilemap=tilemap)
-                canvas.tile_picker = self.app.layerpicker.tilepickers.frames[layer]
-                self.tabbed.attach(layer, canvas)
-            else:
-                idx = int(layer.split()[-1]) - 1
-                parallax = self.app.level.tilemap.parallax[idx]
-                if hasattr(parallax, "tm"):
-                    tm = parallax.tm
-                    canvas = MapCanvas(self.tabbed, Rect(0, 0, self.tabbed.rect.width, self.tabbed.rect.height), tilemap=tm)
-                    canvas.tile_picker = self.app.layerpicker.tilepickers.frames[layer]
-                    self.tabbed.attach(layer, canvas)
-                else:
-                    frame = Frame(self.tabbed, Rect(0, 0, self.tabbed.rect.width, self.tabbed.rect.height))
-                    Label(frame, (10, 10), "No canvas for static parallax")
-                    # create a frame to display the image
-                    self.tabbed.attach(layer, frame)
+            return
+
+        old_layers = self._layers
+        old_frames = {id(layer): frame for layer, frame in zip(old_layers, self.tabbed.frames.values())}
+        self._layers = self.app.layerpicker.get_layers()
+        sync_layer_frames(self.tabbed, self.app.layerpicker.listview.items, self.make_canvas,
+                          added, removed, swapped,
+                          reuse_frame=lambda i: self.reuse_canvas(i, old_frames))
 
 
 # ----- MiniMap Widget ----- #
@@ -676,16 +952,115 @@ class MiniMap(Frame):
         super().__init__(parent, rect)
         self.map_canvas = map_canvas
         self._minimap_surface = None
+        # Minimap with its border baked in, one pixel larger on each side, blitted at _static_pos
+        self._static_minimap_surface: Optional[pygame.Surface] = None
+        self._static_pos: tuple[int, int] = (0, 0)
         self._scale = 1.0
+        # Edits only flag the minimap, it is updated at most once per frame in render:
+        # _dirty asks for a full rebuild, _dirty_tiles lists the cells to redraw
+        self._dirty: bool = False
+        self._dirty_tiles: set[tuple[int, int]] = set()
+        # Background (fill + parallax) and cell edges of the last full rebuild
+        self._base_surface: Optional[pygame.Surface] = None
+        # Transparent black surface as large as a cell, blitted to erase single cells
+        self._clear_surface: Optional[pygame.Surface] = None
+        self._cells_x: list[int] = []
+        self._cells_y: list[int] = []
+        self._origin: tuple[int, int] = (0, 0)
+        # Area of the widget covered by the map, the only part reacting to the mouse
+        self._minimap_draw_rect: Rect = Rect(0, 0, 0, 0)
+        # Camera viewport drawn over the map: position of the map on screen, rect and clip area
+        self._viewport_origin: tuple[int, int] = (0, 0)
+        self._viewport_rect: Rect = Rect(0, 0, 0, 0)
+        self._viewport_clip: Rect = self.rect.inflate(-2, -2)
+        # Map size in pixels, read by center_camera
+        self._map_size: tuple[int, int] = (0, 0)
+        # Tiles and parallax scaled to the minimap, valid for the tileset and scale in _scaled_for
+        self._scaled_tiles: dict[tuple, pygame.Surface] = {}
+        self._scaled_parallax: dict[tuple, pygame.Surface] = {}
+        self._scaled_for: Optional[tuple[TilesetData, float]] = None
 
     def reinit(self):
         """Reinitialize the minimap."""
         self._minimap_surface = None
+        self._static_minimap_surface = None
+
+    def invalidate_parallax(self):
+        """Drop the scaled parallax layers and rebuild the minimap, after the layers changed."""
+        # Keyed by id, a new layer may reuse the id of a removed one
+        self._scaled_parallax.clear()
+        self._dirty = True
+
+    def mark_dirty(self, x: Optional[int] = None, y: Optional[int] = None):
+        """Request a minimap update for the next frame, only around the tile (x, y) if given."""
+        if x is None or y is None:
+            self._dirty = True
+            return
+        # Autotiling makes the neighbors of an edited tile change too
+        self._dirty_tiles.update((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+    def _draw_tiles(self, cells) -> None:
+        """Redraw the given cells of the minimap surface over its background."""
+        tm = self.app.level.tilemap
+        grid = tm.grid
+        x0, y0 = self._origin
+        xs, ys = self._cells_x, self._cells_y
+        blits = []
+        for x, y in cells:
+            if not (0 <= x < tm.width and 0 <= y < tm.height):
+                continue
+            size = (xs[x + 1] - xs[x], ys[y + 1] - ys[y])
+            if not (size[0] and size[1]):
+                continue
+            pos = (x0 + xs[x], y0 + ys[y])
+            # Adding the background onto a cleared cell copies it exactly, a plain blit would blend it.
+            # The cell is cleared by multiplying it with transparent black so it stays in the same batch
+            blits.append((self._clear_surface, pos, Rect((0, 0), size), pygame.BLEND_RGBA_MULT))
+            blits.append((self._base_surface, pos, Rect(pos, size), pygame.BLEND_RGBA_ADD))
+            tid = int(grid[y, x])
+            if tid != -1:
+                blits.append((self._scaled_tile(tm.tileset.tiles[tid], tm.get_tile_neighbors(x, y), size), pos))
+        self._minimap_surface.blits(blits, doreturn=False)
+
+    def _scaled_tile(self, tile: TileData, neighbors: list[bool], size: tuple[int, int]) -> pygame.Surface:
+        """Return the tile rendered with its neighborhood and scaled to size."""
+        key = (id(tile), tile.animation_frame, tuple(neighbors), size)
+        if key not in self._scaled_tiles:
+            self._scaled_tiles[key] = pygame.transform.scale(TileRenderer.render(tile, neighbors), size).convert_alpha()
+        return self._scaled_tiles[key]
+
+    def _scaled_parallax_layer(self, parallax, map_size: tuple[int, int], size: tuple[int, int]) -> pygame.Surface:
+        """Return the part of the parallax seen behind the whole map, scaled to size."""
+        key = (id(parallax), size)
+        if key not in self._scaled_parallax:
+            if isinstance(parallax, FixedParallaxData):
+                p_surf = FixedParallaxRenderer.render(parallax)
+            else:
+                p_surf = TilemapParallaxRenderer.render(parallax)
+            p_w, p_h = p_surf.get_size()
+            map_w, map_h = map_size
+            # Same crop as TilemapRenderer with a camera showing the whole map
+            full = pygame.Surface(map_size, SRCALPHA)
+            full.blit(p_surf, (0, 0), Rect((p_w - map_w) // 2, (p_h - map_h) // 2, map_w, map_h))
+            self._scaled_parallax[key] = pygame.transform.scale(full, size).convert_alpha()
+        return self._scaled_parallax[key]
 
     def update_minimap(self):
         """Update the minimap surface."""
         tm = self.app.level.tilemap
-        tile_size = tm.tileset.tile_size
+        if (not self._dirty and self._minimap_surface is not None
+                and self._scaled_for is not None and self._scaled_for[0] is tm.tileset
+                and len(self._cells_x) == tm.width + 1 and len(self._cells_y) == tm.height + 1):
+            # Only some tiles changed since the last full rebuild
+            self._draw_tiles(self._dirty_tiles)
+            self._dirty_tiles.clear()
+            self._bake_static_surface()
+            return
+
+        self._dirty = False
+        self._dirty_tiles.clear()
+        tileset = tm.tileset
+        tile_size = tileset.tile_size
         map_w = tm.width * tile_size
         map_h = tm.height * tile_size
 
@@ -697,57 +1072,92 @@ class MiniMap(Frame):
         new_w = int(map_w * self._scale)
         new_h = int(map_h * self._scale)
 
-        # Create a full tilemap surface and render to it
-        full_surface = pygame.Surface((map_w, map_h), SRCALPHA)
-        camera = Camera(Vector2(map_w // 2, map_h // 2), (map_w, map_h))
-        TilemapRenderer.clear_cache()
-        TilemapRenderer.render(tm, full_surface, camera, camera)
-        
-        # Scale the rendered tilemap
-        scaled = pygame.transform.smoothscale(full_surface, (new_w, new_h))
-        
-        # Create the minimap display surface
-        minimap_surf = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA)
-        minimap_surf.fill((0, 0, 0, 200))
-        x = (self.rect.width - new_w) // 2
-        y = (self.rect.height - new_h) // 2
-        minimap_surf.blit(scaled, (x, y))
+        if self._scaled_for != (tileset, self._scale):
+            # Keep the tileset referenced so the ids used as keys stay unique
+            self._scaled_tiles.clear()
+            self._scaled_parallax.clear()
+            self._scaled_for = (tileset, self._scale)
+
+        # Create the minimap background, kept to erase single tiles later
+        # Minimap surfaces are kept in the display format so blitting them needs no conversion
+        base = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA).convert_alpha()
+        base.fill((0, 0, 0, 200))
+        x0 = (self.rect.width - new_w) // 2
+        y0 = (self.rect.height - new_h) // 2
+        for parallax in reversed(tm.parallax):
+            base.blit(self._scaled_parallax_layer(parallax, (map_w, map_h), (new_w, new_h)), (x0, y0))
+        self._base_surface = base
+        self._origin = (x0, y0)
+        self._map_size = (map_w, map_h)
+        self._minimap_draw_rect = Rect(x0, y0, new_w, new_h)
+        self._viewport_origin = (self.rect.x + x0, self.rect.y + y0)
+        self._viewport_clip = self.rect.inflate(-2, -2)
+
+        # Tiles are drawn straight at minimap scale, cell edges are rounded down like the map size
+        xs = self._cells_x = [int(i * tile_size * self._scale) for i in range(tm.width + 1)]
+        ys = self._cells_y = [int(i * tile_size * self._scale) for i in range(tm.height + 1)]
+        cell_w = max((b - a for a, b in zip(xs, xs[1:])), default=0)
+        cell_h = max((b - a for a, b in zip(ys, ys[1:])), default=0)
+        self._clear_surface = pygame.Surface((cell_w, cell_h), SRCALPHA).convert_alpha()
+        self._clear_surface.fill((0, 0, 0, 0))
+        # Non empty cells and their neighborhoods are gathered from the grid in vectorized steps
+        cells_y, cells_x = np.nonzero(tm.grid != -1)
+        tids = tm.grid[cells_y, cells_x].tolist()
+        masks = tm.get_neighbor_masks()[cells_y, cells_x].tolist()
+        blits = []
+        for x, y, tid, mask in zip(cells_x.tolist(), cells_y.tolist(), tids, masks):
+            size = (xs[x + 1] - xs[x], ys[y + 1] - ys[y])
+            if size[0] and size[1]:
+                tile = self._scaled_tile(tileset.tiles[tid], MASK_NEIGHBORS[mask], size)
+                blits.append((tile, (x0 + xs[x], y0 + ys[y])))
+        minimap_surf = base.copy()
+        minimap_surf.blits(blits, doreturn=False)
         
         self._minimap_surface = minimap_surf
-
-    def center_camera(self, event: pygame.event.Event):
-        """Center the MapCanvas camera on the minimap click."""
-        if not self._minimap_surface:
+        self._bake_static_surface()
+
+    def _bake_static_surface(self) -> None:
+        """Compose the minimap and its border into the surface blitted each frame."""
+        border = self.rect.inflate(2, 2)
+        static = self._static_minimap_surface
+        if static is None or static.get_size() != border.size:
+            static = self._static_minimap_surface = pygame.Surface(border.size, SRCALPHA).convert_alpha()
+        static.fill((0, 0, 0, 0))
+        static.blit(self._minimap_surface, (1, 1), special_flags=pygame.BLEND_RGBA_ADD)
+        pygame.draw.rect(static, (0, 0, 0), static.get_rect(), 2)
+        self._static_pos = border.topleft
+
+    def center_camera(self, pos: tuple[int, int]):
+        """Center the MapCanvas camera on the point pos of the minimap, in widget coordinates."""
+        if not self._minimap_surface or not self._minimap_draw_rect.collidepoint(pos):
             return
         
-        mouse_pos = Vector2(event.pos) - Vector2(self.global_rect.topleft)
-        tm = self.app.level.tilemap
-        tile_size = tm.tileset.tile_size
-        map_w = tm.width * tile_size
-        map_h = tm.height * tile_size
-        
-        new_w = int(map_w * self._scale)
-        new_h = int(map_h * self._scale)
-        x_offset = (self.rect.width - new_w) // 2
-        y_offset = (self.rect.height - new_h) // 2
-        
-        if x_offset <= mouse_pos.x <= x_offset + new_w and y_offset <= mouse_pos.y <= y_offset + new_h:
-            relative_x = (mouse_pos.x - x_offset) / self._scale
-            relative_y = (mouse_pos.y - y_offset) / self._scale
-            self.map_canvas.scroll.x = max(0, min(relative_x - self.map_canvas.rect.width // 2, map_w - self.map_canvas.rect.width))
-            self.map_canvas.scroll.y = max(0, min(relative_y - self.map_canvas.rect.height // 2, map_h - self.map_canvas.rect.height))
+        map_w, map_h = self._map_size
+        x_offset, y_offset = self._origin
+        relative_x = (pos[0] - x_offset) / self._scale
+        relative_y = (pos[1] - y_offset) / self._scale
+        view_w, view_h = self.map_canvas.rect.size
+        camera = Rect(int(relative_x) - view_w // 2, int(relative_y) - view_h // 2, view_w, view_h)
+        # The bounds are never smaller than the view so a small map keeps the camera at 0
+        camera.clamp_ip(Rect(0, 0, max(map_w, view_w), max(map_h, view_h)))
+        self.map_canvas.scroll.update(camera.topleft)
 
     def handle_event(self, event):
         if not self.displayed:
             return False
         
-        if self.focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
-            self.center_camera(event)
-            return True
-        
-        if self.focus and event.type == pygame.MOUSEMOTION and event.buttons[0]:
-            self.center_camera(event)
-            return True
+        if event.type == MOUSEBUTTONDOWN or event.type == MOUSEMOTION:
+            # The position in widget coordinates is computed once with plain ints,
+            # only the drawn map moves the camera so everything else is skipped right away
+            rect = self.global_rect
+            pos = (event.pos[0] - rect.x, event.pos[1] - rect.y)
+            if not self._minimap_draw_rect.collidepoint(pos):
+                return super().handle_event(event)
+            
+            pressed = event.button == 1 if event.type == MOUSEBUTTONDOWN else event.buttons[0]
+            if self.focus and pressed:
+                self.center_camera(pos)
+                return True
         
         return super().handle_event(event)
 
@@ -755,35 +1165,28 @@ class MiniMap(Frame):
         if not self.displayed:
             return
         
-        if self._minimap_surface is None:
+        if self._minimap_surface is None or self._dirty or self._dirty_tiles:
             self.update_minimap()
         
-        surface.blit(self._minimap_surface, self.rect.topleft)
+        surface.blit(self._static_minimap_surface, self._static_pos)
         
         # Draw camera viewport rectangle
         if self._scale > 0:
-            tm = self.app.level.tilemap
-            tile_size = tm.tileset.tile_size
-            map_w = tm.width * tile_size
-            map_h = tm.height * tile_size
-            new_w = int(map_w * self._scale)
-            new_h = int(map_h * self._scale)
-            x_offset = (self.rect.width - new_w) // 2
-            y_offset = (self.rect.height - new_h) // 2
-            
-            viewport_w = int(self.map_canvas.rect.width * self._scale)
-            viewport_h = int(self.map_canvas.rect.height * self._scale)
-            viewport_x = int(self.map_canvas.scroll.x * self._scale) + x_offset + self.rect.x
-            viewport_y = int(self.map_canvas.scroll.y * self._scale) + y_offset + self.rect.y
-            
-            pygame.draw.rect(
-                surface,
-                self.app.theme.colors["accent"],
-                Rect(viewport_x, viewport_y, viewport_w, viewport_h),
-                2
+            scale = self._scale
+            canvas = self.map_canvas
+            # Plain int math on rects reused across frames
+            self._viewport_rect.update(
+                int(canvas.scroll.x * scale) + self._viewport_origin[0],
+                int(canvas.scroll.y * scale) + self._viewport_origin[1],
+                int(canvas.rect.width * scale),
+                int(canvas.rect.height * scale)
             )
-        
-        pygame.draw.rect(surface, (0, 0, 0), self.rect.inflate(2, 2), 2)
+            
+            # Keep the baked border over the viewport rectangle
+            clip = surface.get_clip()
+            surface.set_clip(clip.clip(self._viewport_clip))
+            pygame.draw.rect(surface, self.app.theme.colors["accent"], self._viewport_rect, 2)
+            surface.set_clip(clip)
 
 
 # ----- Entity Picker ----- #
@@ -843,12 +1246,99 @@ class EntityCanvas(Frame):
         self.tilemap = None
         self.selected_entity_idx: int = -1
         self.dragging_entity_idx: int = -1
+        # Offset from the cursor to the dragged entity, kept so it does not jump to the cursor
+        self._drag_offset: tuple[int, int] = (0, 0)
         self.tile_size = 32  # Default, will be updated
         self.scroll = Vector2(0, 0)
+        # Scroll bounds of the map in the viewport, updated by reinit
+        self._max_scroll: tuple[int, int] = (0, 0)
+        # Entity markers and labels are rasterized once and blitted in one batch per frame
+        self._glyphs: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+        self._markers: dict[tuple[tuple[int, int, int], int], pygame.Surface] = {}
+        # Positions of tm.entities as a (N, 2) array for culling and a spatial hash of their
+        # indices by tile for hit tests, rebuilt lazily after invalidate_entities or when the
+        # entities list is replaced, a dragged entity is moved in both in place
+        self._entity_xy: Optional[np.ndarray] = None
+        self._entity_list: Optional[list] = None
+        self._entity_cells: Optional[dict[tuple[int, int], list[int]]] = None
         
     def get_tilemap(self):
         return self.app.level.tilemap
     
+    def invalidate_entities(self):
+        """Rebuild the entity positions array and spatial hash on next use (entities added, removed or moved)."""
+        self._entity_xy = None
+        self._entity_cells = None
+    
+    def _get_entity_xy(self, entities: list) -> np.ndarray:
+        """Return the (x, y) positions of entities as a float (N, 2) array."""
+        xy = self._entity_xy
+        if xy is None or self._entity_list is not entities or len(xy) != len(entities):
+            xy = np.array([(e.get("x", 0), e.get("y", 0)) for e in entities], dtype=np.float64).reshape(-1, 2)
+            self._entity_xy = xy
+            self._entity_list = entities
+            self._entity_cells = None
+        return xy
+    
+    def _get_entity_cells(self, entities: list) -> dict[tuple[int, int], list[int]]:
+        """Return the indices of entities grouped by the tile (x // tile_size, y // tile_size) they are in."""
+        xy = self._get_entity_xy(entities)
+        if self._entity_cells is None:
+            cells: dict[tuple[int, int], list[int]] = {}
+            for i, cell in enumerate((xy // self.tile_size).astype(np.int64).tolist()):
+                cells.setdefault(tuple(cell), []).append(i)
+            self._entity_cells = cells
+        return self._entity_cells
+    
+    def _move_entity(self, entities: list, index: int, x: int, y: int):
+        """Move the entity at index to (x, y), keeping the positions array and spatial hash up to date."""
+        entity = entities[index]
+        xy = self._entity_xy
+        if xy is not None and self._entity_cells is not None and self._entity_list is entities and len(xy) == len(entities):
+            ts = self.tile_size
+            old = (int(xy[index, 0] // ts), int(xy[index, 1] // ts))
+            new = (x // ts, y // ts)
+            if old != new:
+                self._entity_cells[old].remove(index)
+                self._entity_cells.setdefault(new, []).append(index)
+            xy[index] = (x, y)
+        elif xy is not None:
+            self.invalidate_entities()
+        entity["x"] = x
+        entity["y"] = y
+    
+    def _entity_at(self, entities: list, x: int, y: int) -> int:
+        """Return the index of the first entity within a tile of the world position (x, y), -1 if none."""
+        ts = self.tile_size
+        cells = self._get_entity_cells(entities)
+        xy = self._entity_xy
+        cx, cy = x // ts, y // ts
+        # Entities closer than a tile are at most one cell away
+        hits = [
+            i
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            for i in cells.get((cx + dx, cy + dy), ())
+            if abs(xy[i, 0] - x) < ts and abs(xy[i, 1] - y) < ts
+        ]
+        return min(hits, default=-1)
+    
+    def _glyph(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return the label text rendered with the theme font."""
+        key = (text, tuple(color))
+        if key not in self._glyphs:
+            self._glyphs[key] = self.app.theme.font.render(text, True, color)
+        return self._glyphs[key]
+    
+    def _marker(self, color: tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Return the circle outline drawn around an entity, centered in a (2*radius+2) square."""
+        key = (tuple(color), radius)
+        if key not in self._markers:
+            marker = pygame.Surface((2 * radius + 2, 2 * radius + 2), SRCALPHA)
+            pygame.draw.circle(marker, color, (radius + 1, radius + 1), radius, 2)
+            self._markers[key] = marker
+        return self._markers[key]
+    
     def reinit(self):
         """Reinitialize canvas with tilemap data."""
         tm = self.get_tilemap()
@@ -857,6 +1347,8 @@ class EntityCanvas(Frame):
         width = tm.width * self.tile_size
         height = tm.height * self.tile_size
         self.size = (width, height)
+        self._max_scroll = (max(0, width - self.rect.width), max(0, height - self.rect.height))
+        self.invalidate_entities()
     
     def handle_event(self, event):
         if not self.displayed:
@@ -864,41 +1356,41 @@ class EntityCanvas(Frame):
         
         tm = self.get_tilemap()
         level = self.app.level
+        ts = self.tile_size
+        focus = self.focus
+        properties = getattr(self.app, "entity_properties", None)
         
-        if self.focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
+        if event.type in (MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION):
+            # Convert screen coords to world coords once for every branch
+            left, top = self.global_rect.topleft
+            world_x = int(event.pos[0] - left + self.scroll.x)
+            world_y = int(event.pos[1] - top + self.scroll.y)
+        
+        if focus and event.type == MOUSEBUTTONDOWN and event.button == 1:
             # Check if clicking on selected entity to start drag
             if self.selected_entity_idx == -2:  # -2 means player is selected
-                mouse_pos = Vector2(event.pos)
-                world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-                world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
+                hitbox = level.player.overrides.get("Hitbox", {}) if level.player else {}
+                player_x = hitbox.get("x", 0)
+                player_y = hitbox.get("y", 0)
                 
-                player_x = level.player.overrides.get("Hitbox", {}).get("x", 0) if level.player else 0
-                player_y = level.player.overrides.get("Hitbox", {}).get("y", 0) if level.player else 0
-                
-                if abs(player_x - world_x) < self.tile_size and abs(player_y - world_y) < self.tile_size:
+                if abs(player_x - world_x) < ts and abs(player_y - world_y) < ts:
                     self.dragging_entity_idx = -2  # -2 for player
+                    self._drag_offset = (int(player_x - world_x), int(player_y - world_y))
                     return True
             elif self.selected_entity_idx >= 0:
-                mouse_pos = Vector2(event.pos)
-                world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-                world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
-                
                 entity = tm.entities[self.selected_entity_idx]
                 ex = entity.get("x", 0)
                 ey = entity.get("y", 0)
                 
-                if abs(ex - world_x) < self.tile_size and abs(ey - world_y) < self.tile_size:
+                if abs(ex - world_x) < ts and abs(ey - world_y) < ts:
                     self.dragging_entity_idx = self.selected_entity_idx
+                    self._drag_offset = (int(ex - world_x), int(ey - world_y))
                     return True
             
             # Otherwise place new entity or player
-            if hasattr(self.app, 'entity_picker') and self.app.entity_picker.selected_blueprint:
-                mouse_pos = Vector2(event.pos)
-                # Convert screen coords to world coords
-                world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-                world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
-                
-                blueprint = self.app.entity_picker.selected_blueprint
+            picker = getattr(self.app, "entity_picker", None)
+            if picker is not None and picker.selected_blueprint:
+                blueprint = picker.selected_blueprint
                 
                 if blueprint == "[PLAYER]":
                     # Place player
@@ -915,83 +1407,70 @@ class EntityCanvas(Frame):
                         "overrides": {}
                     }
                     tm.entities.append(entity_data)
+                    self.invalidate_entities()
                     self.logger.text = f"Placed {blueprint} at ({world_x}, {world_y})"
                 
-                if hasattr(self.app, 'entity_properties'):
-                    self.app.entity_properties.refresh()
+                if properties is not None:
+                    properties.mark_dirty()
                 return True
         
-        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        if event.type == MOUSEBUTTONUP and event.button == 1:
             # Stop dragging
             if self.dragging_entity_idx == -2:  # Player
-                player_x = self.app.level.player.overrides.get("Hitbox", {}).get("x", 0)
-                player_y = self.app.level.player.overrides.get("Hitbox", {}).get("y", 0)
-                self.logger.text = f"Moved Player to ({player_x}, {player_y})"
+                hitbox = level.player.overrides.get("Hitbox", {})
+                self.logger.text = f"Moved Player to ({hitbox.get('x', 0)}, {hitbox.get('y', 0)})"
                 self.dragging_entity_idx = -1
-                if hasattr(self.app, 'entity_properties'):
-                    self.app.entity_properties.refresh()
+                if properties is not None:
+                    properties.mark_dirty()
                 return True
             elif self.dragging_entity_idx >= 0:
                 entity = tm.entities[self.dragging_entity_idx]
                 self.logger.text = f"Moved {entity.get('blueprint')} to ({entity.get('x')}, {entity.get('y')})"
                 self.dragging_entity_idx = -1
-                if hasattr(self.app, 'entity_properties'):
-                    self.app.entity_properties.refresh()
+                if properties is not None:
+                    properties.mark_dirty()
                 return True
         
-        if self.focus and event.type == pygame.MOUSEMOTION and self.dragging_entity_idx == -2:
+        if focus and event.type == MOUSEMOTION and self.dragging_entity_idx == -2:
             # Drag player
-            mouse_pos = Vector2(event.pos)
-            world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-            world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
-            
-            if self.app.level.player:
-                self.app.level.player.overrides["Hitbox"] = {"x": world_x, "y": world_y}
+            if level.player:
+                dx, dy = self._drag_offset
+                level.player.overrides["Hitbox"] = {"x": world_x + dx, "y": world_y + dy}
             return True
         
-        if self.focus and event.type == pygame.MOUSEMOTION and self.dragging_entity_idx >= 0:
+        if focus and event.type == MOUSEMOTION and self.dragging_entity_idx >= 0:
             # Drag entity
-            mouse_pos = Vector2(event.pos)
-            world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-            world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
-            
-            entity = tm.entities[self.dragging_entity_idx]
-            entity["x"] = world_x
-            entity["y"] = world_y
+            dx, dy = self._drag_offset
+            self._move_entity(tm.entities, self.dragging_entity_idx, world_x + dx, world_y + dy)
             return True
         
-        if self.focus and event.type == MOUSEBUTTONDOWN and event.button == 3:
+        if focus and event.type == MOUSEBUTTONDOWN and event.button == 3:
             # Select entity at clicked position
-            mouse_pos = Vector2(event.pos)
-            world_x = int(mouse_pos.x - self.global_rect.left + self.scroll.x)
-            world_y = int(mouse_pos.y - self.global_rect.top + self.scroll.y)
-            
             # Check if clicking on player
-            level = self.app.level
             if level.player:
-                player_x = level.player.overrides.get("Hitbox", {}).get("x", 0)
-                player_y = level.player.overrides.get("Hitbox", {}).get("y", 0)
-                if abs(player_x - world_x) < self.tile_size and abs(player_y - world_y) < self.tile_size:
+                hitbox = level.player.overrides.get("Hitbox", {})
+                player_x = hitbox.get("x", 0)
+                player_y = hitbox.get("y", 0)
+                if abs(player_x - world_x) < ts and abs(player_y - world_y) < ts:
                     self.selected_entity_idx = -2  # -2 represents player
                     self.logger.text = f"Selected Player at ({player_x}, {player_y})"
-                    if hasattr(self.app, 'entity_properties'):
-                        self.app.entity_properties.refresh()
+                    if properties is not None:
+                        properties.mark_dirty()
                     return True
             
-            # Find entity at position (within 32 pixels)
-            for i, entity in enumerate(tm.entities):
-                ex = entity.get("x", 0)
-                ey = entity.get("y", 0)
-                if abs(ex - world_x) < self.tile_size and abs(ey - world_y) < self.tile_size:
-                    self.selected_entity_idx = i
-                    self.logger.text = f"Selected entity: {entity.get('blueprint')} at ({ex}, {ey})"
-                    if hasattr(self.app, 'entity_properties'):
-                        self.app.entity_properties.refresh()
-                    return True
+            # Find the first entity at position (within a tile)
+            i = self._entity_at(tm.entities, world_x, world_y)
+            if i != -1:
+                entity = tm.entities[i]
+                self.selected_entity_idx = i
+                self.logger.text = f"Selected entity: {entity.get('blueprint')} at ({entity.get('x', 0)}, {entity.get('y', 0)})"
+                if properties is not None:
+                    properties.mark_dirty()
+                return True
             
             self.selected_entity_idx = -1
-            if hasattr(self.app, 'entity_properties'):
-                self.app.entity_properties.refresh()
+            if properties is not None:
+                properties.mark_dirty()
             return False
         
         # Handle scrolling
@@ -1002,15 +1481,13 @@ class EntityCanvas(Frame):
                 if event.y > 0:
                     self.scroll.x = max(0, self.scroll.x - 50)
                 else:
-                    max_scroll_x = max(0, self.size[0] - self.rect.width)
-                    self.scroll.x = min(max_scroll_x, self.scroll.x + 50)
+                    self.scroll.x = min(self._max_scroll[0], self.scroll.x + 50)
             else:
                 # Vertical scroll
                 if event.y > 0:
                     self.scroll.y = max(0, self.scroll.y - 50)
                 else:
-                    max_scroll_y = max(0, self.size[1] - self.rect.height)
-                    self.scroll.y = min(max_scroll_y, self.scroll.y + 50)
+                    self.scroll.y = min(self._max_scroll[1], self.scroll.y + 50)
             return True
         
         return super().handle_event(event)
@@ -1021,21 +1498,19 @@ class EntityCanvas(Frame):
         
         tm = self.get_tilemap()
         level = self.app.level
+        # Everything is drawn in viewport coords, only the viewport part of the surface is used
+        view = Rect((0, 0), self.rect.size)
+        self.surface.set_clip(view)
         self.surface.fill((50, 50, 50))
         
-        # Render tilemap first
-        viewport_surface = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA)
-        viewport_surface.fill((0, 0, 0, 0))
-        
-        TilemapRenderer.clear_cache()
-        
+        # Render tilemap first, straight on the canvas surface
         # Create camera for this viewport (pos is center, not top-left)
         center = self.scroll + Vector2(self.rect.width // 2, self.rect.height // 2)
         camera = Camera(center, (self.rect.width, self.rect.height))
-        TilemapRenderer.render(tm, viewport_surface, camera, camera)
+        TilemapRenderer.render(tm, self.surface, camera)
         
-        # Blit the viewport directly to the destination
-        self.surface.blit(viewport_surface, (0, 0))
+        half = self.tile_size // 2
+        blits = []
         
         # Draw player on top of tilemap
         if level.player:
@@ -1050,34 +1525,36 @@ class EntityCanvas(Frame):
             if -self.tile_size < surf_x < self.rect.width and -self.tile_size < surf_y < self.rect.height:
                 # Draw player as a larger circle or different shape
                 color = self.app.theme.colors["accent"] if self.selected_entity_idx == -2 else (50, 150, 255)
-                pygame.draw.circle(self.surface, color, (surf_x + self.tile_size // 2, surf_y + self.tile_size // 2), 10, 2)
+                blits.append((self._marker(color, 10), (surf_x + half - 11, surf_y + half - 11)))
                 
                 # Draw "P" for player
-                text = self.app.theme.font.render("P", True, (50, 150, 255))
-                self.surface.blit(text, (surf_x + 6, surf_y + 6))
+                blits.append((self._glyph("P", (50, 150, 255)), (surf_x + 6, surf_y + 6)))
         
-        # Draw entities on top of tilemap
-        for i, entity in enumerate(tm.entities):
-            ex = entity.get("x", 0)
-            ey = entity.get("y", 0)
+        # Draw entities on top of tilemap, converted to surface coords (truncated like int())
+        # and culled to the viewport all at once
+        xy = self._get_entity_xy(tm.entities)
+        if _NUMBA_AVAILABLE:
+            visible, coords = _cull_entities(xy, self.scroll.x, self.scroll.y, self.tile_size, *self.rect.size)
+        else:
+            surf_xy = (xy - (self.scroll.x, self.scroll.y)).astype(np.int64)
+            visible = np.flatnonzero((surf_xy[:, 0] > -self.tile_size) & (surf_xy[:, 0] < self.rect.width)
+                                     & (surf_xy[:, 1] > -self.tile_size) & (surf_xy[:, 1] < self.rect.height))
+            coords = surf_xy[visible]
+        for i, (surf_x, surf_y) in zip(visible.tolist(), coords.tolist()):
+            entity = tm.entities[i]
             
-            # Convert world coords to surface coords
-            surf_x = int(ex - self.scroll.x)
-            surf_y = int(ey - self.scroll.y)
+            # Draw entity as a circle
+            color = self.app.theme.colors["accent"] if i == self.selected_entity_idx else (100, 200, 100)
+            blits.append((self._marker(color, 8), (surf_x + half - 9, surf_y + half - 9)))
             
-            # Only draw if in viewport
-            if -self.tile_size < surf_x < self.rect.width and -self.tile_size < surf_y < self.rect.height:
-                # Draw entity as a circle
-                color = self.app.theme.colors["accent"] if i == self.selected_entity_idx else (100, 200, 100)
-                pygame.draw.circle(self.surface, color, (surf_x + self.tile_size // 2, surf_y + self.tile_size // 2), 8, 2)
-                
-                # Draw blueprint name
-                blueprint = entity.get("blueprint", "?")
-                text = self.app.theme.font.render(blueprint[:2], True, (200, 200, 200))
-                self.surface.blit(text, (surf_x + 4, surf_y + 4))
+            # Draw blueprint name
+            blueprint = entity.get("blueprint", "?")
+            blits.append((self._glyph(blueprint[:2], (200, 200, 200)), (surf_x + 4, surf_y + 4)))
+        self.surface.blits(blits, doreturn=False)
+        self.surface.set_clip(None)
         
-        # Blit scrollable content to the display surface
-        surface.blit(self.surface, self.rect.topleft)
+        # Blit the viewport to the display surface
+        surface.blit(self.surface, self.rect.topleft, view)
         
         self.draw_scrollbars(surface)
         pygame.draw.rect(surface, (0, 0, 0), self.rect.inflate(2, 2), 2)
@@ -1092,9 +1569,16 @@ class EntityProperties(Frame):
         self.logger = self.app.label_info
         self.selected_idx: int = -1
         self.property_widgets: dict = {}
+        # Set by canvas events, the widgets are rebuilt at most once per frame in render
+        self._dirty: bool = False
+    
+    def mark_dirty(self):
+        """Request a refresh of the properties display before the next render."""
+        self._dirty = True
         
     def refresh(self):
         """Refresh properties display."""
+        self._dirty = False
         # Clear old widgets
         self.children.clear()
         self.property_widgets.clear()
@@ -1181,6 +1665,7 @@ class EntityProperties(Frame):
         if canvas and canvas.selected_entity_idx >= 0:
             tm = self.app.level.tilemap
             entity = tm.entities.pop(canvas.selected_entity_idx)
+            canvas.invalidate_entities()
             self.logger.text = f"Deleted entity: {entity.get('blueprint')}"
             canvas.selected_entity_idx = -1
             self.refresh()
@@ -1221,6 +1706,7 @@ class EntityProperties(Frame):
                 entity['x'] = int(self.property_widgets['x'].text)
             if 'y' in self.property_widgets:
                 entity['y'] = int(self.property_widgets['y'].text)
+            canvas.invalidate_entities()
             self.logger.text = f"Updated entity at ({entity['x']}, {entity['y']})"
         except ValueError:
             self.logger.text = "Error: Invalid position values"
@@ -1229,6 +1715,9 @@ class EntityProperties(Frame):
         if not self.displayed:
             return
         
+        if self._dirty:
+            self.refresh()
+        
         self.surface.fill(self.app.theme.colors["bg"])
         Frame.render(self, surface)
 
@@ -1244,8 +1733,13 @@ class LevelEditor(UIApp):
         display.set_icon(pygame.image.load("icon.ico").convert())
         UIApp.__init__(self, size)
         self.running = True
-        self.level = AssetsRegistry.load_level("empty", Engine())
+        self.level = self.load_level("empty")
         self.level.tilemap.name = "temp"
+        # Time since the last animation update and delay before a tile changes frame, per tileset id
+        self._animation_clocks: dict[int, tuple[float, float]] = {}
+        # Saves are formatted on the main thread and written to disk by a writer thread
+        self._save_queue: queue.Queue[dict[str, str]] = queue.Queue()
+        threading.Thread(target=self._save_writer, name="save-writer", daemon=True).start()
         # Ensure parallax list exists
         if self.level.tilemap.parallax is None:
             self.level.tilemap.parallax = []
@@ -1278,19 +1772,19 @@ class LevelEditor(UIApp):
         toolbar = Frame(parent=None, rect=Rect(0, 24, size[0], 48))
         main_layer.add(toolbar)
         
-        IconButton(toolbar, Rect(0, 0, 48, 48), new_icon, self.new_level)
-        IconButton(toolbar, Rect(48, 0, 48, 48), open_icon, self.open_level)
-        IconButton(toolbar, Rect(96, 0, 48, 48), save_icon, self.save_file)
+        IconButton(toolbar, Rect(0, 0, 48, 48), get_icon("new"), self.new_level)
+        IconButton(toolbar, Rect(48, 0, 48, 48), get_icon("open"), self.open_level)
+        IconButton(toolbar, Rect(96, 0, 48, 48), get_icon("save"), self.save_file)
 
         self.tools_selector = Selector(
             toolbar, (240, 0),
-            {"brush": brush_icon, "fill": fill_icon, "rect": rect_icon}
+            {"brush": get_icon("brush"), "fill": get_icon("fill"), "rect": get_icon("rectangle")}
         )
         self.tools_selector.selected_index = 0
 
         edition = Selector(
             toolbar, (896, 0),
-            {"tilemap": tilemap_icon, "entities": entity_icon}
+            {"tilemap": get_icon("tilemap"), "entities": get_icon("entity")}
         )
         edition.selected_index = 0
 
@@ -1377,15 +1871,16 @@ class LevelEditor(UIApp):
             self.level.tilemap.tileset = AssetsRegistry.load_tileset(tileset_list.get_text())
             self.level.tilemap.width = tilemap_width
             self.level.tilemap.height = tilemap_height
-            self.level.tilemap.grid = [[-1 for _ in range(tilemap_width)] for _ in range(tilemap_height)]
+            self.level.tilemap.grid = np.full((tilemap_height, tilemap_width), -1, dtype=np.int16)
             self.level.tilemap.entities = []
             self.level.tilemap.parallax = []
+            TilemapRenderer.invalidate(self.level.tilemap)
             
             self.layerpicker.refresh()
             self.layer_canvas.refresh()
             self.entity_canvas.reinit()
             self.entity_properties.refresh()
-            self.minimap.update_minimap()
+            self.minimap.mark_dirty()
             self.label_info.text = f"Level '{level_name}' created"
 
     def save_tileset(self, tileset: TilesetData):
@@ -1398,63 +1893,40 @@ class LevelEditor(UIApp):
                 "animation_delay": tile.animation_delay
             })
 
-        string: str = (
-            "{" + "\n" +
-            f'\t"tile_size": {tileset.tile_size},\n' +
-            f'\t"files": {list({tile.blueprint["file"] for tile in tiles})},\n' +
-            f'\t"tiles": [\n\t\t{",\n\t\t".join(inline_dict(tile.blueprint) for tile in tiles)}\n\t]\n' +
-            "}"
-        ).replace("'", "\"")
+        string = format_json({
+            "tile_size": tileset.tile_size,
+            "files": sorted({tile.blueprint["file"] for tile in tiles}),
+            "tiles": [tile.blueprint for tile in tiles]
+        })
 
-        with open(os.path.join(config.TILESET_DATA_FOLDER, f"{tileset.name}.json"), "w", encoding="utf-8") as f:
-            f.write(string)
-        
+        self.write_files({os.path.join(config.TILESET_DATA_FOLDER, f"{tileset.name}.json"): string})
         self.label_info.text = "Tileset saved"
 
     def save_tilemap(self, tilemap: TilemapData):
         """Save tilemap data."""
-        # Format entities as JSON
-        entities_json = "["
-        for i, entity in enumerate(tilemap.entities):
-            entities_json += f'\n\t\t{{"blueprint": "{entity.get("blueprint", "")}", "x": {entity.get("x", 0)}, "y": {entity.get("y", 0)}, "overrides": {{}}}}'
-            if i < len(tilemap.entities) - 1:
-                entities_json += ","
-        entities_json += "\n\t]" if tilemap.entities else "[]"
-        
-        # Format parallax layers as JSON
-        parallax_json = "["
-        for i, parallax in enumerate(tilemap.parallax):
-            if isinstance(parallax, FixedParallaxData):
-                # Get image path from blueprint dict
-                blueprint = parallax.blueprint or {}
-                image_path = blueprint.get("img", "")
-                parallax_json += f'\n\t\t{{"type": "img", "path": "{image_path}"}}'
-            elif isinstance(parallax, TilemapParallaxData):
-                # Get tilemap name from blueprint dict
-                blueprint = parallax.blueprint or {}
-                tilemap_name = blueprint.get("name", parallax.tm.name)
-                parallax_json += f'\n\t\t{{"type": "tilemap", "name": "{tilemap_name}"}}'
-            if i < len(tilemap.parallax) - 1:
-                parallax_json += ","
-        parallax_json += "\n\t]"
-        if tilemap.parallax == []:
-            parallax_json = "[]"
-        
-        string = (
-            "{" + "\n" +
-            f'\t"size": {[tilemap.width, tilemap.height]},\n' +
-            f'\t"bgm": "{tilemap.bgm}",\n' +
-            f'\t"bgs": "{tilemap.bgs}",\n' +
-            f'\t"tileset": "{tilemap.tileset.name}",\n' +
-            f'\t"tiles": {format_grid(tilemap.grid, 1)},\n' +
-            f'\t"entities": {entities_json},\n' +
-            f'\t"parallax": {parallax_json}\n' +
-            "}"
-        ).replace("'", "\"")
-
-        with open(os.path.join(config.TILEMAP_FOLDER, f"{tilemap.name}.json"), "w", encoding="utf-8") as f:
-            f.write(string)
-        
+        parallax = []
+        for layer in tilemap.parallax:
+            # Image path or tilemap name come from the blueprint dict
+            blueprint = layer.blueprint or {}
+            if isinstance(layer, FixedParallaxData):
+                parallax.append({"type": "img", "path": blueprint.get("img", "")})
+            elif isinstance(layer, TilemapParallaxData):
+                parallax.append({"type": "tilemap", "name": blueprint.get("name", layer.tm.name)})
+
+        string = format_json({
+            "size": [tilemap.width, tilemap.height],
+            "bgm": tilemap.bgm,
+            "bgs": tilemap.bgs,
+            "tileset": tilemap.tileset.name,
+            "tiles": tilemap.grid,
+            "entities": [
+                {"blueprint": entity.get("blueprint", ""), "x": entity.get("x", 0), "y": entity.get("y", 0), "overrides": {}}
+                for entity in tilemap.entities
+            ],
+            "parallax": parallax
+        })
+
+        self.write_files({os.path.join(config.TILEMAP_FOLDER, f"{tilemap.name}.json"): string})
         self.label_info.text = "Tilemap saved"
 
     def save_level(self, level: Level):
@@ -1469,19 +1941,56 @@ class LevelEditor(UIApp):
         else:
             player_data = {"Hitbox": {"x": 0, "y": 0}}
         
-        with open(os.path.join(config.LEVELS_FOLDER, f"{level.name}.json"), "w", encoding="utf-8") as f:
-            f.write(dumps({
-                "tilemap": level.tilemap.name,
-                "systems": level.systems,
-                "player": player_data,
-                "camera": {
-                    "x": level.camera.centerx if level.camera else 0,
-                    "y": level.camera.centery if level.camera else 0
-                }
-            }, indent=4))
-        
+        string = dumps({
+            "tilemap": level.tilemap.name,
+            "systems": level.systems,
+            "player": player_data,
+            "camera": {
+                "x": level.camera.centerx if level.camera else 0,
+                "y": level.camera.centery if level.camera else 0
+            }
+        }, indent=4)
+
+        self.write_files({os.path.join(config.LEVELS_FOLDER, f"{level.name}.json"): string})
         self.label_info.text = "Level saved"
 
+    def write_files(self, files: dict[str, str]):
+        """Queue the texts of files by path for the writer thread, the saved data is already a snapshot."""
+        self._save_queue.put(files)
+
+    def _save_writer(self):
+        """Write the queued files, older pending contents of a path are replaced by the newest."""
+        while True:
+            files = dict(self._save_queue.get())
+            jobs = 1
+            # Saves queued while the last ones were written are merged
+            while True:
+                try:
+                    files.update(self._save_queue.get_nowait())
+                    jobs += 1
+                except queue.Empty:
+                    break
+            try:
+                for path, text in files.items():
+                    # Written next to the file then swapped in, a failed save never leaves a truncated file
+                    tmp_path = f"{path}.tmp"
+                    try:
+                        with open(tmp_path, "w", encoding="utf-8") as f:
+                            f.write(text)
+                        os.replace(tmp_path, path)
+                    except Exception as error:
+                        # Any error (encoding included) is reported, the writer keeps serving the queue
+                        try:
+                            if os.path.exists(tmp_path):
+                                os.remove(tmp_path)
+                        except OSError:
+                            pass
+                        pygame.event.post(pygame.event.Event(SAVE_ERROR_EVENT, message=f"Error: could not save {path} ({error})"))
+            finally:
+                # run() waits on the queue before exiting, every job must be released
+                for _ in range(jobs):
+                    self._save_queue.task_done()
+
     def save_file(self):
         """Save current level."""
         if self.level.name == "empty":
@@ -1524,9 +2033,10 @@ class LevelEditor(UIApp):
             AssetsRegistry.clear_cache()
             name = os.path.splitext(os.path.basename(filepath))[0]
             self.level.tilemap.tileset = AssetsRegistry.load_tileset(name)
+            TilemapRenderer.invalidate(self.level.tilemap)
             self.layerpicker.refresh()
             self.layer_canvas.refresh()
-            self.minimap.update_minimap()
+            self.minimap.mark_dirty()
             self.label_info.text = f"Loaded tileset '{name}'"
 
     def open_tilemap(self):
@@ -1540,7 +2050,7 @@ class LevelEditor(UIApp):
             self.layer_canvas.refresh()
             self.entity_canvas.reinit()
             self.entity_properties.refresh()
-            self.minimap.update_minimap()
+            self.minimap.mark_dirty()
             self.label_info.text = f"Loaded tilemap '{name}'"
 
     def open_level(self):
@@ -1549,7 +2059,7 @@ class LevelEditor(UIApp):
         if filepath:
             AssetsRegistry.clear_cache()
             name = os.path.splitext(os.path.basename(filepath))[0]
-            self.level = AssetsRegistry.load_level(name, Engine())
+            self.level = self.load_level(name)
             # Ensure parallax list exists
             if self.level.tilemap.parallax is None:
                 self.level.tilemap.parallax = []
@@ -1557,33 +2067,123 @@ class LevelEditor(UIApp):
             self.layer_canvas.refresh()
             self.entity_canvas.reinit()
             self.entity_properties.refresh()
-            self.minimap.update_minimap()
+            self.minimap.mark_dirty()
             self.label_info.text = f"Loaded level '{name}'"
 
+    def load_level(self, name: str) -> Level:
+        """Read a level in a worker thread while the window shows a loading screen, then build it."""
+        # The worker only reads and parses the JSON files, surfaces and registry caches stay on this thread
+        result: queue.Queue = queue.Queue(maxsize=1)
+        def load():
+            try:
+                result.put((AssetsRegistry.read_level_files(name), None))
+            except Exception as error:
+                result.put((None, error))
+        threading.Thread(target=load, name=f"load-level-{name}", daemon=True).start()
+
+        text = self.theme.font.render(f"Loading level '{name}'...", True, self.theme.colors["text"])
+        while True:
+            try:
+                files, error = result.get(timeout=1 / MAX_FPS)
+                break
+            except queue.Empty:
+                pygame.event.pump()
+                self.screen.fill((40, 40, 40))
+                self.screen.blit(text, text.get_rect(center=self.screen.get_rect().center))
+                display.flip()
+        if error is not None:
+            raise error
+        return AssetsRegistry.load_level(name, Engine(), files)
+
+    def used_tilesets(self) -> list[TilesetData]:
+        """Return the tilesets of the level tilemap and its tilemap parallax, each once."""
+        tilemap = self.level.tilemap
+        tilesets = {id(tilemap.tileset): tilemap.tileset}
+        for parallax in tilemap.parallax or []:
+            if hasattr(parallax, "tm"):
+                tilesets.setdefault(id(parallax.tm.tileset), parallax.tm.tileset)
+        return list(tilesets.values())
+
+    @staticmethod
+    def _next_animation_tick(tileset: TilesetData) -> float:
+        """Return the time before an animated tile of the tileset changes frame."""
+        return min((tile.animation_time_left for tile in tileset.tiles if len(tile.graphics) > 1), default=float("inf"))
+
+    def animate_tilesets(self, tilesets: list[TilesetData], dt: float) -> bool:
+        """Advance the animations of the tilesets, return True if a tile changed frame."""
+        clocks = {}
+        changed = False
+        for tileset in tilesets:
+            elapsed, next_tick = self._animation_clocks.get(id(tileset)) or (0.0, self._next_animation_tick(tileset))
+            elapsed += dt
+            # No frame changes before the earliest tile deadline, so the tiles are only walked then
+            if elapsed > next_tick:
+                tileset.update_animation(elapsed)
+                elapsed, next_tick = 0.0, self._next_animation_tick(tileset)
+                changed = True
+            clocks[id(tileset)] = (elapsed, next_tick)
+        self._animation_clocks = clocks
+        return changed
+
+    def next_animation_delay(self) -> float:
+        """Return the time before a tile of the animated tilesets changes frame, inf if none is animated."""
+        return min((next_tick - elapsed for elapsed, next_tick in self._animation_clocks.values()), default=float("inf"))
+
+    def present(self, rects: Optional[list[Rect]] = None):
+        """Show the rendered screen, only the given rects when they cover a small part of it."""
+        width, height = self.screen.get_size()
+        if rects is not None and sum(r.w * r.h for r in rects) <= DIRTY_AREA_RATIO * width * height:
+            display.update(rects)
+        else:
+            display.flip()
+
     def run(self):
         """Run the application."""
         clock = time.Clock()
+        redraw = True
         while self.running:
-            dt = clock.tick() / 1000
+            dt = clock.tick(MAX_FPS) / 1000
             
-            for e in pygame.event.get():
+            events = pygame.event.get()
+            if not events and not redraw:
+                # Nothing changes on screen before the next event or animation frame: sleep on the queue
+                timeout = int(min(self.next_animation_delay(), IDLE_WAIT_MS / 1000) * 1000) + 1
+                event = pygame.event.wait(timeout)
+                events = [event, *pygame.event.get()] if event else []
+            
+            # Mouse work on the focused canvas only changes the areas that canvas reports
+            canvas = self.focused_widget if isinstance(self.focused_widget, MapCanvas) else None
+            hovered = self.hovered_widget
+            for e in events:
                 if e.type == QUIT:
                     self.running = False
+                elif e.type == SAVE_ERROR_EVENT:
+                    self.label_info.text = e.message
                 else:
                     self.handle_events(e)
+            partial = (
+                canvas is not None and self.focused_widget is canvas and self.hovered_widget is hovered is canvas
+                and all(e.type in CANVAS_EVENTS for e in events)
+            )
             
-            # Update tilesets animations
-            tilesets = [AssetsRegistry.load_tileset(ts) for ts in AssetsRegistry.list_assets("tileset")]
-            for tileset in tilesets:
-                tileset.update_animation(dt)
+            # Update animations of the tilesets in use
+            animated = self.animate_tilesets(self.used_tilesets(), dt)
             
-            self.screen.fill((40, 40, 40))
-            self.render(self.screen)
-            display.flip()
-
-        # Save before exit
+            # The screen is only redrawn and presented when an event or an animation may have changed it
+            if redraw or events or animated:
+                self.screen.fill((40, 40, 40))
+                self.render(self.screen)
+                self.present(canvas.dirty_rects if partial and not (redraw or animated) else None)
+            if canvas is not None:
+                canvas.dirty_rects.clear()
+            if isinstance(self.focused_widget, MapCanvas):
+                self.focused_widget.dirty_rects.clear()
+            redraw = False
+
+        # Save before exit, waiting for the writer thread to finish
         if self.level.name != "empty":
             self.save_file()
+        self._save_queue.join()
 
 
 if __name__ == "__main__":
@@ -14,10 +14,18 @@ ________________________________________________________________________________
 # import external modules
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from os import listdir
+from os import listdir, stat
 from os.path import join, splitext
-from json import load
-from pygame import Surface, Rect, Vector2
+from time import time_ns
+from pygame import Surface, Rect, Vector2, SRCALPHA, surfarray
+
+# orjson parses several times faster, json stays the fallback
+try:
+    from orjson import loads
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads
+    _ORJSON_AVAILABLE = False
 
 # import header
 from .header import ComponentTypes as C
@@ -41,6 +49,9 @@ from .level.level import Level
 # import camera
 from .level.components import Camera
 
+# import tile renderer
+from .rendering.tilemap_renderer import TileRenderer, NO_NEIGHBORS
+
 # import AssetsCache
 from .assets_cache import AssetsCache
 
@@ -60,6 +71,9 @@ if TYPE_CHECKING:
     from .ecs_core.engine import Engine
     from .dialog.component import Dialog
 
+# ----- Constants of the module ----- #
+MTIME_RESOLUTION_NS: int = 2_000_000_000 # coarsest folder mtime step handled (FAT), in ns
+
 
 # ----- AssetsRegistry ----- #
 class AssetsRegistry:
@@ -73,6 +87,9 @@ class AssetsRegistry:
     _levels: dict[str, Level] = {}
     _ai_scripts: dict[str, dict] = {}
     _dialogs: dict[str, Dialog] = {}
+    _atlases: dict[tuple[int, int], tuple[tuple[int, ...], Surface]] = {}
+    _asset_lists: dict[str, tuple[int, int, list[str]]] = {}
+    _parsed_files: dict[str, dict] = {}
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -86,9 +103,30 @@ class AssetsRegistry:
         cls._blueprints.clear()
         cls._ai_scripts.clear()
         cls._dialogs.clear()
+        cls._atlases.clear()
+        cls._asset_lists.clear()
 
         logger.debug("AssetsRegistry cache cleared")
 
+    @classmethod
+    def _read_json(cls, path: str) -> dict:
+        """
+        Return the parsed JSON file at path
+        Files already parsed by read_level_files are not read again
+        """
+        data = cls._parsed_files.pop(path, None)
+        if data is None:
+            with open(path, "rb") as file:
+                data = loads(file.read())
+        return data
+
+    @classmethod
+    def clear_atlases(cls) -> None:
+        """
+        Clear the tileset atlases (when tiles are edited in place)
+        """
+        cls._atlases.clear()
+
     @classmethod
     def load_tileset(cls, tileset_name: str) -> TilesetData:
         """
@@ -98,37 +136,34 @@ class AssetsRegistry:
 
         if tileset_name not in cls._tilesets:
             tiles = []
-            with open(join(config.TILESET_DATA_FOLDER,f"{tileset_name}.json"),
-                    "r",
-                    encoding="utf-8") as file:
-                data: dict = load(file)
-                tsize = data.get("tile_size", 48)
-                images = {
-                    f: AssetsCache.load_image(join(config.TILESET_GRAPHICS_FOLDER, f))
-                    for f in data.get("files")
-                }
-                tile: dict
-                for tile in data.get("tiles"):
-                    graphics = tuple(
-                        images[tile.get("file")].subsurface(
-                            Rect(
-                                Vector2(frame)*tsize,
-                                Vector2(config.AUTOTILING_SHAPES[tile.get("type", "unique")])*tsize
-                            )
+            data: dict = cls._read_json(join(config.TILESET_DATA_FOLDER, f"{tileset_name}.json"))
+            tsize = data.get("tile_size", 48)
+            images = {
+                f: AssetsCache.load_image(join(config.TILESET_GRAPHICS_FOLDER, f))
+                for f in data.get("files")
+            }
+            tile: dict
+            for tile in data.get("tiles"):
+                graphics = tuple(
+                    images[tile.get("file")].subsurface(
+                        Rect(
+                            Vector2(frame)*tsize,
+                            Vector2(config.AUTOTILING_SHAPES[tile.get("type", "unique")])*tsize
                         )
-                        for frame in tile.get("frames")
                     )
-                    tiles.append(
-                        TileData(
-                            graphics,
-                            size=tsize,
-                            hitbox=tile.get("hitbox"),
-                            autotilebitmask=tile.get("type"),
-                            animation_delay=tile.get("animation_delay", 0.333),
-                            blueprint=tile
-                        )
+                    for frame in tile.get("frames")
+                )
+                tiles.append(
+                    TileData(
+                        graphics,
+                        size=tsize,
+                        hitbox=tile.get("hitbox"),
+                        autotilebitmask=tile.get("type"),
+                        animation_delay=tile.get("animation_delay", 0.333),
+                        blueprint=tile
                     )
-                    logger.debug(f"Tile loaded: {tile}")
+                )
+                logger.debug(f"Tile loaded: {tile}")
 
             cls._tilesets[tileset_name] = TilesetData(tileset_name, tiles, tsize)
             logger.info(f"Tileset [{tileset_name}] loaded and cached")
@@ -136,6 +171,39 @@ class AssetsRegistry:
         logger.info(f"Tileset [{tileset_name}] loaded successfully")
         return cls._tilesets[tileset_name]
 
+    @classmethod
+    def get_atlas(cls, tileset: TilesetData, tiles_per_row: int) -> Surface:
+        """
+        Return a surface with every tile of the tileset drawn alone, tiles_per_row per row
+        Only the tiles whose animation frame changed are redrawn
+        """
+        key = (id(tileset), tiles_per_row)
+        frames = tuple(tile.animation_frame for tile in tileset.tiles)
+        cached = cls._atlases.get(key)
+        if cached is not None and cached[0] == frames:
+            return cached[1]
+
+        tile_size = tileset.tile_size
+        if cached is None or len(cached[0]) != len(frames):
+            n_rows = (len(tileset.tiles) + tiles_per_row - 1) // tiles_per_row
+            atlas = Surface((tiles_per_row * tile_size, n_rows * tile_size), SRCALPHA)
+            changed = range(len(frames))
+        else:
+            atlas = cached[1]
+            changed = [idx for idx, (old, new) in enumerate(zip(cached[0], frames)) if old != new]
+
+        # Tiles and atlas share the SRCALPHA pixel format: each tile is one raw numpy copy,
+        # which also overwrites the previous frame without clearing the cell first
+        pixels = surfarray.pixels2d(atlas)
+        for idx in changed:
+            x, y = (idx % tiles_per_row) * tile_size, (idx // tiles_per_row) * tile_size
+            tile = TileRenderer.render(tileset.tiles[idx], NO_NEIGHBORS)
+            pixels[x:x + tile_size, y:y + tile_size] = surfarray.pixels2d(tile)
+        del pixels # unlock the atlas
+
+        cls._atlases[key] = (frames, atlas)
+        return atlas
+
     @classmethod
     def load_parallax(cls, parallax_key: dict) -> ParallaxData:
         """
@@ -165,16 +233,13 @@ class AssetsRegistry:
         If already loaded once return it from cache
         """
         if tilemap_name not in cls._tilemaps:
-            with open(join(config.TILEMAP_FOLDER, f"{tilemap_name}.json"),
-                      "r",
-                      encoding="utf-8") as file:
-                data: dict = load(file)
-                width, height = data.get("size")
-                bgm = data.get("bgm")
-                bgs = data.get("bgs")
-                tileset = cls.load_tileset(data.get("tileset"))
-                grid = data.get("tiles")
-                parallax = [cls.load_parallax(d) for d in data.get("parallax", [])]
+            data: dict = cls._read_json(join(config.TILEMAP_FOLDER, f"{tilemap_name}.json"))
+            width, height = data.get("size")
+            bgm = data.get("bgm")
+            bgs = data.get("bgs")
+            tileset = cls.load_tileset(data.get("tileset"))
+            grid = data.get("tiles")
+            parallax = [cls.load_parallax(d) for d in data.get("parallax", [])]
 
             cls._tilemaps[tilemap_name] = TilemapData(
                 tilemap_name,
@@ -197,10 +262,7 @@ class AssetsRegistry:
         If already loaded return it from cache
         """
         if blueprint_name not in cls._blueprints:
-            with open(join(config.BLUEPRINTS_FOLDER, f"{blueprint_name}.json"),
-                      "r",
-                      encoding="utf-8") as file:
-                data = load(file)
+            data = cls._read_json(join(config.BLUEPRINTS_FOLDER, f"{blueprint_name}.json"))
             cls._blueprints[blueprint_name] = EntityBlueprint(
                 blueprint_name,
                 data.get("components", []),
@@ -212,15 +274,53 @@ class AssetsRegistry:
         return cls._blueprints[blueprint_name]
 
     @classmethod
-    def load_level(cls, level_name: str, engine: Engine) -> Level:
+    def read_level_files(cls, level_name: str) -> dict[str, dict]:
+        """
+        Read and parse the JSON files of the Level named level_name, by path
+        (level, tilemaps, tilesets and blueprints), without building any asset
+        Only touches the filesystem so it can run outside of the main thread
+        """
+        files: dict[str, dict] = {}
+
+        def read(path: str) -> dict:
+            if path not in files:
+                with open(path, "rb") as file:
+                    files[path] = loads(file.read())
+            return files[path]
+
+        data = read(join(config.LEVELS_FOLDER, f"{level_name}.json"))
+        tilemaps = [data.get("tilemap")]
+        while tilemaps:
+            path = join(config.TILEMAP_FOLDER, f"{tilemaps.pop()}.json")
+            if path in files:
+                continue
+            tilemap = read(path)
+            read(join(config.TILESET_DATA_FOLDER, f"{tilemap.get('tileset')}.json"))
+            tilemaps += [d.get("name") for d in tilemap.get("parallax", []) if d.get("type") == "tilemap"]
+        for entity_data in [{"name": "player"}, *data.get("entities", [])]:
+            read(join(config.BLUEPRINTS_FOLDER, f"{entity_data.get('name')}.json"))
+        return files
+
+    @classmethod
+    def load_level(cls, level_name: str, engine: Engine, files: dict[str, dict] | None = None) -> Level:
         """
         Load and return the Level named level_name
         If already loaded return it from cache
+        files: JSON files already parsed by read_level_files
+        """
+        cls._parsed_files = dict(files or {})
+        try:
+            return cls._load_level(level_name, engine)
+        finally:
+            # Files of assets already in cache are not used
+            cls._parsed_files = {}
+
+    @classmethod
+    def _load_level(cls, level_name: str, engine: Engine) -> Level:
+        """
+        Load and return the Level named level_name (see load_level)
         """
-        with open(join(config.LEVELS_FOLDER, f"{level_name}.json"),
-                      "r",
-                      encoding="utf-8") as file:
-            data: dict = load(file)
+        data: dict = cls._read_json(join(config.LEVELS_FOLDER, f"{level_name}.json"))
         if level_name not in cls._levels:
             tilemap = cls.load_tilemap(data.get("tilemap"))
             systems = data.get("systems", config.SYSTEM_PRIORITY)
@@ -280,6 +380,7 @@ class AssetsRegistry:
         """
         Return a list of available assets by type (from filesystem).
         asset_type: "tileset" | "tilemap" | "blueprint" | "level"
+        The folder is only listed again when its modification time changed
         """
         if asset_type == "tileset":
             folder = config.TILESET_DATA_FOLDER
@@ -296,11 +397,19 @@ class AssetsRegistry:
         else:
             raise ValueError(f"Unknown asset type: {asset_type}")
 
-        return [
-            splitext(f)[0]
-            for f in listdir(folder)
-            if f.endswith(ext)
-        ]
+        mtime = stat(folder).st_mtime_ns
+        cached = cls._asset_lists.get(asset_type)
+        # A listing taken within the mtime step of the last change may miss a later change
+        # stamped with the same mtime (coarse mtime filesystems), it is taken again
+        if cached is None or cached[0] != mtime or cached[1] - mtime < MTIME_RESOLUTION_NS:
+            listed = time_ns()
+            cached = (mtime, listed, [
+                splitext(f)[0]
+                for f in listdir(folder)
+                if f.endswith(ext)
+            ])
+            cls._asset_lists[asset_type] = cached
+        return list(cached[2])
 
     @classmethod
     def list_all_assets(cls) -> dict[str, list[str]]:
@@ -14,7 +14,8 @@ ________________________________________________________________________________
 # import  external modules
 from __future__ import annotations
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 from pygame import Surface, Rect
 
 # create constants of the module
@@ -25,6 +26,17 @@ SHAPES: dict[str, tuple[int, int]] = {
     "unique": (1, 1)
 }
 
+NEIGHBOR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1,  0),          (1,  0),
+    (-1,  1), (0,  1), (1,  1)
+)
+
+# Neighbors list of every connection mask of get_neighbor_masks (bit i is the neighbor i)
+MASK_NEIGHBORS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(bool(mask >> i & 1) for i in range(8)) for mask in range(256)
+)
+
 
 # ----- TileData ----- #
 @dataclass
@@ -50,6 +62,23 @@ class TilesetData:
     name: str
     tiles: list[TileData]
     tile_size: int
+    # Per tile lookup tables indexed by tile id, the extra last entry answers for empty cells (-1)
+    hitboxes: np.ndarray = field(init=False, repr=False)
+    animated: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Build the per tile lookup tables
+        """
+        self.refresh_tables()
+
+    def refresh_tables(self) -> None:
+        """
+        Rebuild the lookup tables from the tiles attributes
+        Must be called after changing the hitbox of a tile
+        """
+        self.hitboxes = np.array([bool(tile.hitbox) for tile in self.tiles] + [False], dtype=bool)
+        self.animated = np.array([len(tile.graphics) > 1 for tile in self.tiles] + [False], dtype=bool)
 
     def update_animation(self, dt: float) -> None:
         """
@@ -86,12 +115,7 @@ class TilemapParallaxData:
         """
         Return if the parallax is animated
         """
-        return any(
-            len(self.tm.tileset.tiles[tile_id].graphics) > 1
-            for row in self.tm.grid
-            for tile_id in row
-            if tile_id != -1
-        )
+        return bool(self.tm.tileset.animated[self.tm.grid].any())
 
 
 # ----- TilemapData ----- #
@@ -106,16 +130,21 @@ class TilemapData:
     tileset: TilesetData
     bgm: str
     bgs: str
-    grid: list[list[int]]
+    grid: np.ndarray
     parallax: list[ParallaxData]
 
+    def __post_init__(self) -> None:
+        """
+        Store the grid as a contiguous int16 array indexed as grid[y, x]
+        """
+        self.grid = np.asarray(self.grid, dtype=np.int16)
+
     def _hitbox_at(self, x: int, y: int) -> bool:
         """
         Test if the tile (x, y) has hitbox
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            tid = self.grid[y][x]
-            return tid != -1 and self.tileset.tiles[tid].hitbox
+            return bool(self.tileset.hitboxes[self.grid[y, x]])
         return False
 
     def get_tile_neighbors(self, x: int, y: int) -> list[bool]:
@@ -127,18 +156,33 @@ class TilemapData:
         (-1,  1), (0,  1), (1,  1)
         If we are in border it return True by default
         """
-        offset = [(-1, -1), (0, -1), (1, -1),
-                  (-1,  0),          (1,  0),
-                  (-1,  1), (0,  1), (1,  1)]
+        grid = self.grid
+        tid = int(grid[y, x])
         neighbors = []
-        for dx, dy in offset:
+        for dx, dy in NEIGHBOR_OFFSETS:
             tx, ty = x+dx, y+dy
             if 0 <= tx < self.width and 0 <= ty < self.height:
-                neighbors.append(self.grid[ty][tx] == self.grid[y][x])
+                neighbors.append(int(grid[ty, tx]) == tid)
             else:
                 neighbors.append(True)
         return neighbors
 
+    def get_neighbor_masks(self) -> np.ndarray:
+        """
+        Return the neighbors connections of every tile at once as an uint8 grid[y, x]
+        bit i is set when get_tile_neighbors(x, y)[i] is True, see MASK_NEIGHBORS
+        """
+        grid = self.grid
+        height, width = grid.shape
+        # Cells outside the map are marked -2, they connect to every tile
+        padded = np.full((height + 2, width + 2), -2, dtype=np.int16)
+        padded[1:-1, 1:-1] = grid
+        masks = np.zeros((height, width), dtype=np.uint8)
+        for i, (dx, dy) in enumerate(NEIGHBOR_OFFSETS):
+            shifted = padded[1+dy:1+dy+height, 1+dx:1+dx+width]
+            masks |= ((shifted == grid) | (shifted == -2)).astype(np.uint8) << i
+        return masks
+
     def colliderect(self, rect: Rect) -> bool:
         """
         Check if a Rect overlap a colliding tile
@@ -146,10 +190,10 @@ class TilemapData:
         tile_size = self.tileset.tile_size
         range_x = range(max(0, rect.left//tile_size-1), min(rect.right//tile_size+1, self.width))
         range_y = range(max(0, rect.top//tile_size-1), min(rect.bottom//tile_size+1, self.height))
+        hitboxes = self.tileset.hitboxes
         for x in range_x:
             for y in range_y:
-                tid = self.grid[y][x]
-                if tid != -1 and self.tileset.tiles[tid].hitbox:
+                if hitboxes[self.grid[y, x]]:
                     tile_rect = Rect(x * tile_size, y * tile_size, tile_size, tile_size)
                     if tile_rect.colliderect(rect):
                         return True
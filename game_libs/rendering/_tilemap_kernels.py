@@ -0,0 +1,48 @@
+#-*- coding: utf-8 -*-
+
+"""
+SHIFT PROJECT libs
+____________________________________________________________________________________________________
+tilemap kernels lib
+version : 1.0
+____________________________________________________________________________________________________
+Contains the compiled grid loops of the tilemap renderer
+____________________________________________________________________________________________________
+(c) Lafiteau Franck
+"""
+
+# import external modules
+from __future__ import annotations
+import numpy as np
+
+try:
+    # Numba imports (optional, the kernels run as plain Python without it)
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*_args, **_kwargs):
+        """
+        Fallback decorator keeping the kernels in pure Python
+        """
+        return lambda func: func
+
+
+# ----- Kernels ----- #
+@njit(cache=True)
+def visible_cells(grid: np.ndarray, tl_x: int, tl_y: int, br_x: int, br_y: int) -> np.ndarray:
+    """
+    Return the (tile_id, x, y) rows of the non empty cells in [tl_x, br_x[ x [tl_y, br_y[
+    """
+    out = np.empty((max(0, br_y-tl_y)*max(0, br_x-tl_x), 3), np.int32)
+    k = 0
+    for y in range(tl_y, br_y):
+        for x in range(tl_x, br_x):
+            t = grid[y, x]
+            if t >= 0:
+                out[k, 0] = t
+                out[k, 1] = x
+                out[k, 2] = y
+                k += 1
+    return out[:k]
@@ -13,6 +13,7 @@ ________________________________________________________________________________
 
 # import external modules
 from __future__ import annotations
+from typing import Iterable, Sequence
 from pygame import Surface, Rect, Vector2, SRCALPHA
 
 # import tilemap components
@@ -24,8 +25,13 @@ from ..level.tilemap import (
     ParallaxData
 )
 from ..level.components import Camera
+from ._tilemap_kernels import visible_cells
 
 # ----- Constants of the module ----- #
+NO_NEIGHBORS: tuple[bool, ...] = (False,) * 8 # neighbors of a tile drawn on its own
+CHUNK_SIZE: int = 16 # side in tiles of the pre-rendered tilemap chunks
+CHUNK_MARGIN: int = 4 # pre-rendered chunks kept by TilemapRenderer beyond those a view shows
+
 AUTOTILEBITMASKS: dict[str, dict[str, list[tuple[int, int]]]] = {
     "field": {
         "TL": [(0, 0), (0, 2), (1, 1), (1, 0), (1, 2)],
@@ -85,7 +91,7 @@ class TileRenderer:
         cls._cache.clear()
 
     @classmethod
-    def render(cls, tdata: TileData, neighbors: list[bool]) -> Surface:
+    def render(cls, tdata: TileData, neighbors: Sequence[bool]) -> Surface:
         """
         Render a tile according to neighborhood
         """
@@ -95,16 +101,18 @@ class TileRenderer:
             return cls._cache[key]
 
         surf = Surface((tdata.size, tdata.size), SRCALPHA)
+        graphic = tdata.graphics[tdata.animation_frame]
+        half = tdata.size // 2
 
+        # the four corners are sent to SDL in a single blits call
+        blits = []
         for i, corner in enumerate(("TL", "TR", "BL", "BR")):
-            offsetx, offsety = tdata.size//2 * (i%2), tdata.size // 2 * (i//2)
+            offsetx, offsety = half * (i%2), half * (i//2)
 
             bitmask = sum(neighbors[b]<<j for j, b in enumerate(cls.corner_neighbors[corner]))
             x, y = AUTOTILEBITMASKS[tdata.autotilebitmask][corner][cls.corner_bitmask[bitmask]]
-            corner_graphic = tdata.graphics[tdata.animation_frame].subsurface(
-                Rect(x*tdata.size+offsetx, y*tdata.size+offsety, tdata.size//2, tdata.size//2)
-            )
-            surf.blit(corner_graphic, (offsetx, offsety))
+            blits.append((graphic, (offsetx, offsety), Rect(x*tdata.size+offsetx, y*tdata.size+offsety, half, half)))
+        surf.blits(blits, doreturn=False)
 
         cls._cache[key] = surf
         return surf
@@ -143,15 +151,15 @@ class TilemapParallaxRenderer:
             ),
             SRCALPHA
         )
-        for y, row in enumerate(pdata.tm.grid):
+        tile_size = pdata.tm.tileset.tile_size
+        blits = []
+        for y, row in enumerate(pdata.tm.grid.tolist()):
             for x, tid in enumerate(row):
                 if tid != -1:
                     tdata = pdata.tm.tileset.tiles[tid]
                     neighbors = pdata.tm.get_tile_neighbors(x, y)
-                    surf.blit(
-                        TileRenderer.render(tdata, neighbors),
-                        Vector2(x, y)*pdata.tm.tileset.tile_size
-                    )
+                    blits.append((TileRenderer.render(tdata, neighbors), (x*tile_size, y*tile_size)))
+        surf.blits(blits, doreturn=False)
 
         if not pdata.animated:
             cls._cache[pdata.tm.name] = surf
@@ -163,11 +171,16 @@ class TilemapParallaxRenderer:
 class TilemapRenderer:
     """
     Renderer of Tilemap
+
+    The tilemap is pre-rendered in chunks of CHUNK_SIZE x CHUNK_SIZE tiles kept in a
+    least recently used cache, a frame only blits the visible chunks
     """
     _neighbors_cache: dict[tuple[int, int], tuple[bool, ...]] = {}
-    _last_surface: Surface | None = None
-    _last_camera_pos: Vector2 | None = None
-    _animated_tiles: list[tuple[int, int]] = []
+    _last_tilemap: TilemapData | None = None
+    _chunks: dict[tuple[int, int], Surface] = {}
+    _max_chunks: int = 0
+    _chunk_animated: dict[tuple[int, int], dict[int, tuple[int, list[tuple[int, int]]]]] = {}
+    _dirty_tiles: set[tuple[int, int]] = set()
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -175,9 +188,50 @@ class TilemapRenderer:
         Clear Renderer cache
         """
         cls._neighbors_cache.clear()
-        cls._animated_tiles.clear()
-        cls._last_surface = None
-        cls._last_camera_pos = None
+        cls._chunks.clear()
+        cls._chunk_animated.clear()
+        cls._dirty_tiles.clear()
+        cls._max_chunks = 0
+        cls._last_tilemap = None
+
+    @classmethod
+    def invalidate(cls, tilemap: TilemapData) -> None:
+        """
+        Drop the cached render of tilemap (grid replaced, resized or tileset swapped in place)
+        Other tilemaps are not cached, rendering one of them rebuilds the cache anyway
+        """
+        if tilemap is cls._last_tilemap:
+            cls.clear_cache()
+
+    @classmethod
+    def invalidate_tiles(cls, tilemap: TilemapData, tiles: Iterable[tuple[int, int]]) -> None:
+        """
+        Redraw the edited tiles (x, y) of tilemap and their autotile neighbors on next render
+        """
+        if tilemap is not cls._last_tilemap:
+            return
+        for x, y in tiles:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    cls._neighbors_cache.pop((x+dx, y+dy), None)
+                    cls._dirty_tiles.add((x+dx, y+dy))
+
+    @classmethod
+    def invalidate_area(cls, tilemap: TilemapData, x1: int, y1: int, x2: int, y2: int) -> None:
+        """
+        Drop the chunks overlapping the edited tiles x1..x2, y1..y2 (inclusive) of tilemap
+        and their autotile neighbors, they are rebuilt from the grid on next render
+        """
+        if tilemap is not cls._last_tilemap:
+            return
+        x1, y1, x2, y2 = x1 - 1, y1 - 1, x2 + 1, y2 + 1
+        for y in range(y1, y2 + 1):
+            for x in range(x1, x2 + 1):
+                cls._neighbors_cache.pop((x, y), None)
+        for cy in range(y1 // CHUNK_SIZE, y2 // CHUNK_SIZE + 1):
+            for cx in range(x1 // CHUNK_SIZE, x2 // CHUNK_SIZE + 1):
+                if cls._chunks.pop((cx, cy), None) is not None:
+                    del cls._chunk_animated[(cx, cy)]
 
     @classmethod
     def _render_parallax(cls,
@@ -218,61 +272,115 @@ class TilemapRenderer:
             surface.blit(p_surf, offset)
 
     @classmethod
-    def _redraw_full(cls, tilemap: TilemapData, camera: Camera) -> None:
+    def _tile_blit(cls, tilemap: TilemapData, x: int, y: int, pos: tuple[int, int]) -> tuple[Surface, tuple[int, int]]:
         """
-        Redraw full tilemap
+        Get the blit of the non empty tile (x, y) of tilemap at pos
         """
-        cam_rect = camera.rect
-        tile_size = tilemap.tileset.tile_size
-
-        cls._last_surface.fill((0, 0, 0, 0))
-        cls._animated_tiles.clear()
-
-        # get visible boundaries
-        range_x = range(cam_rect.left//tile_size, min(cam_rect.right//tile_size+1, tilemap.width))
-        range_y = range(cam_rect.top//tile_size, min(cam_rect.bottom//tile_size+1, tilemap.height))
-
-        tiles_drawn = 0
-        for y in range_y:
-            for x in range_x:
-                tid = tilemap.grid[y][x]
+        if (x, y) not in cls._neighbors_cache:
+            cls._neighbors_cache[(x, y)] = tilemap.get_tile_neighbors(x, y)
+        tdata = tilemap.tileset.tiles[int(tilemap.grid[y, x])]
+        return TileRenderer.render(tdata, cls._neighbors_cache[(x, y)]), pos
 
-                if tid == -1:
-                    continue
-
-                tdata = tilemap.tileset.tiles[tid]
-                pos = Vector2(x, y)*tile_size - Vector2(cam_rect.topleft)
-
-                if (x, y) not in cls._neighbors_cache:
-                    cls._neighbors_cache[(x, y)] = tilemap.get_tile_neighbors(x, y)
-                neighbors = cls._neighbors_cache[(x, y)]
-
-                tile_surf = TileRenderer.render(tdata, neighbors)
-                cls._last_surface.blit(tile_surf, pos)
-                tiles_drawn += 1
+    @classmethod
+    def _build_chunk(cls, tilemap: TilemapData, cx: int, cy: int) -> Surface:
+        """
+        Pre-render the chunk (cx, cy) of tilemap
+        """
+        tile_size = tilemap.tileset.tile_size
+        chunk_px = CHUNK_SIZE * tile_size
+        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+
+        chunk = Surface((chunk_px, chunk_px), SRCALPHA)
+        cells = visible_cells(
+            tilemap.grid,
+            x0,
+            y0,
+            min(x0 + CHUNK_SIZE, tilemap.width),
+            min(y0 + CHUNK_SIZE, tilemap.height)
+        )
 
-                # check if tile is animated
-                if len(tdata.graphics) > 1:
-                    cls._animated_tiles.append((x, y))
+        tiles = tilemap.tileset.tiles
+        # animated cells by tile id, with the animation frame they are drawn with
+        animated: dict[int, tuple[int, list[tuple[int, int]]]] = {}
+        blits = []
+        for tid, x, y in cells.tolist():
+            blits.append(cls._tile_blit(tilemap, x, y, ((x - x0)*tile_size, (y - y0)*tile_size)))
+            # check if tile is animated
+            if len(tiles[tid].graphics) > 1:
+                animated.setdefault(tid, (tiles[tid].animation_frame, []))[1].append((x, y))
+        chunk.blits(blits, doreturn=False)
+
+        # Drop the least recently used chunks when the cache is full
+        while cls._chunks and len(cls._chunks) >= cls._max_chunks:
+            oldest = next(iter(cls._chunks))
+            del cls._chunks[oldest]
+            del cls._chunk_animated[oldest]
+        cls._chunks[(cx, cy)] = chunk
+        cls._chunk_animated[(cx, cy)] = animated
+        return chunk
 
     @classmethod
-    def _redraw_dirty(cls, tilemap: TilemapData, camera: Camera) -> None:
+    def _redraw_cells(cls, tilemap: TilemapData, chunk_key: tuple[int, int], cells: Iterable[tuple[int, int]]) -> None:
         """
-        Redraw animated tiles of tilemap
+        Redraw cells (x, y) of a cached chunk over a cleared background
         """
-        cam_rect = camera.rect
+        chunk = cls._chunks[chunk_key]
         tile_size = tilemap.tileset.tile_size
+        x0, y0 = chunk_key[0] * CHUNK_SIZE, chunk_key[1] * CHUNK_SIZE
 
-        for (x, y) in cls._animated_tiles:
-            tid = tilemap.grid[y][x] # can't be -1
-
-            tdata = tilemap.tileset.tiles[tid]
-            pos = Vector2(x, y)*tile_size - Vector2(cam_rect.topleft)
+        blits = []
+        for x, y in cells:
+            pos = ((x - x0)*tile_size, (y - y0)*tile_size)
+            chunk.fill((0, 0, 0, 0), Rect(pos, (tile_size, tile_size)))
+            if tilemap.grid[y, x] != -1:
+                blits.append(cls._tile_blit(tilemap, x, y, pos))
+        chunk.blits(blits, doreturn=False)
 
-            neighbors = cls._neighbors_cache[(x, y)] # can't be None
-            tile_surf = TileRenderer.render(tdata, neighbors)
+    @classmethod
+    def _redraw_animated(cls, tilemap: TilemapData, chunk_key: tuple[int, int]) -> None:
+        """
+        Redraw the animated cells of a cached chunk whose tile changed frame since they were drawn
+        """
+        tiles = tilemap.tileset.tiles
+        animated = cls._chunk_animated[chunk_key]
+        cells = []
+        for tid, (frame, tid_cells) in animated.items():
+            current = tiles[tid].animation_frame
+            if current != frame:
+                animated[tid] = (current, tid_cells)
+                cells.extend(tid_cells)
+        if cells:
+            cls._redraw_cells(tilemap, chunk_key, cells)
 
-            cls._last_surface.blit(tile_surf, pos)
+    @classmethod
+    def _redraw_dirty(cls, tilemap: TilemapData) -> None:
+        """
+        Redraw the invalidated tiles of tilemap in the cached chunks
+        """
+        by_chunk: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        for x, y in cls._dirty_tiles:
+            key = (x // CHUNK_SIZE, y // CHUNK_SIZE)
+            # chunks not cached yet are built from the edited grid anyway
+            if key in cls._chunks and 0 <= x < tilemap.width and 0 <= y < tilemap.height:
+                by_chunk.setdefault(key, []).append((x, y))
+        cls._dirty_tiles.clear()
+
+        tiles = tilemap.tileset.tiles
+        for key, cells in by_chunk.items():
+            cls._redraw_cells(tilemap, key, cells)
+            # edited cells may start or stop being animated
+            edited = set(cells)
+            animated = {}
+            for tid, (frame, tid_cells) in cls._chunk_animated[key].items():
+                kept = [cell for cell in tid_cells if cell not in edited]
+                if kept:
+                    animated[tid] = (frame, kept)
+            for x, y in cells:
+                tid = int(tilemap.grid[y, x])
+                if tid != -1 and len(tiles[tid].graphics) > 1:
+                    # a cell joining a group drawn with an older frame is redrawn with it, harmless
+                    animated.setdefault(tid, (tiles[tid].animation_frame, []))[1].append((x, y))
+            cls._chunk_animated[key] = animated
 
     @classmethod
     def render(cls, tilemap: TilemapData, surface: Surface, camera_interp: Camera) -> None:
@@ -284,26 +392,41 @@ class TilemapRenderer:
         # Snap interpolated position to integer pixels for tilemap grid alignment
         render_pos = Vector2(round(interp_pos.x), round(interp_pos.y))
 
-        # No offset: tilemap stays on pixel grid
-        offset = (0, 0)
-        
         # render parallax with snapped camera
         tile_cam = Camera(render_pos, camera_interp.size)
         for parallax in reversed(tilemap.parallax):
             cls._render_parallax(tilemap, parallax, surface, tile_cam)
-            
-
-        if not cls._last_surface:
-            cls._last_surface = Surface(camera_interp.rect.size, SRCALPHA)
-
-        # Redraw when interpolated camera position (snapped) changes by 1+ pixel
-        # This gives fluid tile updates without sub-pixel jitter
-        if cls._last_camera_pos is None or (render_pos - cls._last_camera_pos).length() >= 1.0:
-            cls._redraw_full(tilemap, tile_cam)
-            cls._last_camera_pos = Vector2(render_pos)
-        else:
-            # Just update animated tiles with current camera position
-            cls._redraw_dirty(tilemap, tile_cam)
 
-        # Blit the pre-rendered tilemap at pixel boundary
-        surface.blit(cls._last_surface, offset)
+        # Caches are only valid for the last rendered tilemap
+        if tilemap is not cls._last_tilemap:
+            cls.clear_cache()
+            cls._last_tilemap = tilemap
+
+        if cls._dirty_tiles:
+            cls._redraw_dirty(tilemap)
+
+        cam_rect = tile_cam.rect
+        chunk_px = CHUNK_SIZE * tilemap.tileset.tile_size
+        left, top = cam_rect.topleft
+
+        # The cache holds the chunks of the largest view rendered since the last clear
+        # (an unaligned view overlaps one more chunk per axis) plus a margin to scroll back
+        view_chunks = (-(-cam_rect.width // chunk_px) + 1) * (-(-cam_rect.height // chunk_px) + 1)
+        cls._max_chunks = max(cls._max_chunks, view_chunks + CHUNK_MARGIN)
+
+        blits = []
+        for cy in range(max(0, top // chunk_px), min(cam_rect.bottom // chunk_px + 1, -(-tilemap.height // CHUNK_SIZE))):
+            for cx in range(max(0, left // chunk_px), min(cam_rect.right // chunk_px + 1, -(-tilemap.width // CHUNK_SIZE))):
+                key = (cx, cy)
+                chunk = cls._chunks.pop(key, None)
+                if chunk is None:
+                    chunk = cls._build_chunk(tilemap, cx, cy)
+                else:
+                    # reinsert to mark the chunk as most recently used
+                    cls._chunks[key] = chunk
+                    if cls._chunk_animated[key]:
+                        cls._redraw_animated(tilemap, key)
+                blits.append((chunk, (cx*chunk_px - left, cy*chunk_px - top)))
+
+        # Blit the pre-rendered chunks at pixel boundary
+        surface.blits(blits, doreturn=False)
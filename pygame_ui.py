@@ -174,6 +174,8 @@ class UILayer:
         Handle a single pygame event
         """
         for w in reversed(self.widgets):
+            if w.event_mask is not None and event.type not in w.event_mask:
+                continue
             if w.handle_event(event):
                 return True
         return False
@@ -191,6 +193,9 @@ class UIWidget:
     """
     Widget of a pygame ui App
     """
+    # Event types dispatched to the widget (and its children), None means every event
+    event_mask: Optional[frozenset[int]] = None
+
     def __init__(self, parent: Optional[UIWidget], rect: Rect) -> None:
         self.parent = parent
         self.rect = rect
@@ -217,8 +222,11 @@ class UIWidget:
         if not self.parent:
             return self.rect
         pr = self.parent.global_rect
-        scroll = getattr(self.parent, "scroll", Vector2(0, 0))
-        return self.rect.move(Vector2(pr.topleft) - scroll)
+        # Scalar offsets, this runs for every widget on every mouse event
+        scroll = getattr(self.parent, "scroll", None)
+        if scroll is None:
+            return self.rect.move(pr.topleft)
+        return self.rect.move(pr.left - scroll.x, pr.top - scroll.y)
 
     @property
     def hover(self) -> bool:
@@ -241,6 +249,8 @@ class UIWidget:
         if not self.displayed:
             return False
         for child in reversed(self.children):
+            if child.event_mask is not None and event.type not in child.event_mask:
+                continue
             if child.handle_event(event):
                 return True
         return False
@@ -625,7 +635,7 @@ class Frame(UIWidget):
             child.render(self.surface)
 
         surface_rect = Rect(self.scroll, self.rect.size)
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
+        surface.blit(self.surface, self.rect, surface_rect)
 
         self.draw_scrollbars(surface)
         draw_rect(surface, (0, 0, 0), self.rect.inflate(2, 2), 2)
@@ -729,7 +739,7 @@ class DropdownList(Frame):
         if self.hover:
             surface_rect.x = self.scroll.x
             surface_rect.y = self.scroll.y
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
+        surface.blit(self.surface, self.rect, surface_rect)
 
         if self.hover:
             self.draw_scrollbars(surface)
@@ -976,8 +986,8 @@ class TextArea(Frame):
             
         # blit scrollable content
         surface_rect = Rect(self.scroll, self.rect.size)
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
-        surface.blit(numeration_surface.subsurface(render_rect), (self.rect.left, self.rect.top))
+        surface.blit(self.surface, self.rect, surface_rect)
+        surface.blit(numeration_surface, (self.rect.left, self.rect.top), render_rect)
         
         # draw scrollbars and border
         self.draw_scrollbars(surface)
@@ -1096,7 +1106,7 @@ class ListView(Frame):
 
         # Blit scrollable content
         surface_rect = Rect((0, 0), self.rect.size)
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
+        surface.blit(self.surface, self.rect, surface_rect)
 
         # Draw scrollbars
         self.draw_scrollbars(surface)
@@ -1211,7 +1221,7 @@ class DualListToggle(Frame):
 
         # Blit scrollable content
         surface_rect = Rect(self.scroll, self.rect.size)
-        surface.blit(self.surface.subsurface(surface_rect), self.rect)
+        surface.blit(self.surface, self.rect, surface_rect)
 
         # Scrollbars
         self.draw_scrollbars(surface)
@@ -1359,6 +1369,15 @@ class TabbedFrame(Frame):
         frame.parent = self
         frame.displayed = False
 
+    def detach(self, name: str) -> Frame:
+        """
+        Detach the frame attached by name and remove it from the children.
+        """
+        frame = self.frames.pop(name)
+        if frame in self.children:
+            self.children.remove(frame)
+        return frame
+
     def update_frame(self) -> None:
         """
         Update which frame is displayed based on the selector's current selection.